@@ -174,9 +174,8 @@ class MindScopeServer:
         db_status = dict(db_status)
         db_status["aiModel"] = self._ai_model_status(self.ai_auditor)
 
-        pcs = await self.db.list_pcs()
         init_msg = Message.init(VERSION, db_status)
-        init_msg.data["profiles"] = [pc.to_dict() for pc in pcs]
+        init_msg.data["profiles"] = await self.db.list_pc_dicts()
         await websocket.send(init_msg.to_json())
 
         try:
@@ -204,3 +203,18 @@ class MindScopeServer:
             *(client.send(payload) for client in self.clients),
             return_exceptions=True,
         )
+
+    async def broadcast_many(self, msgs: list[Message]) -> None:
+        """Send several messages to all clients, preserving order per client."""
+        if not self.clients or not msgs:
+            return
+        payloads = [msg.to_json() for msg in msgs]
+        await asyncio.gather(
+            *(self._send_all(client, payloads) for client in self.clients),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    async def _send_all(client: ServerConnection, payloads: list[str]) -> None:
+        for payload in payloads:
+            await client.send(payload)
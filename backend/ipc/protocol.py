@@ -5,6 +5,23 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback; orjson is only a speed-up
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> str:
+        # Text frames need str; orjson returns UTF-8 bytes
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
 
 class MessageType(Enum):
     """All IPC message types."""
@@ -76,11 +93,11 @@ class Message:
         payload: dict[str, Any] = {"type": self.type, "data": self.data}
         if self.request_id:
             payload["requestId"] = self.request_id
-        return json.dumps(payload)
+        return _dumps(payload)
 
     @classmethod
     def from_json(cls, raw: str) -> "Message":
-        payload = json.loads(raw)
+        payload = _loads(raw)
         return cls(
             type=payload.get("type", ""),
             data=payload.get("data", {}),
@@ -105,3 +122,16 @@ class Message:
             type=MessageType.INIT.value,
             data={"version": version, "dbStatus": db_status},
         )
+
+
+@dataclass
+class EncodedMessage(Message):
+    """A message whose JSON text was assembled by the sender.
+
+    For hot payloads that are mostly constant; ``to_json()`` returns
+    ``encoded`` unchanged and ``data`` is left empty.
+    """
+    encoded: str = ""
+
+    def to_json(self) -> str:
+        return self.encoded
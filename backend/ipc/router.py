@@ -70,6 +70,15 @@ class MessageRouter:
         if self.server:
             await self.server.broadcast(msg)
 
+    async def _broadcast_many(self, msgs: list[Message]) -> None:
+        """Broadcast several messages in order via server if available."""
+        if self.server:
+            await self.server.broadcast_many(msgs)
+
+    def _client_count(self) -> int:
+        """Number of connected WebSocket clients."""
+        return len(self.server.clients) if self.server else 0
+
     # --- Phase 1 Handlers ---
 
     async def _handle_ping(self, msg: Message) -> Message:
@@ -89,17 +98,18 @@ class MessageRouter:
         pc = await self.db.get_pc(pc_id)
         if pc is None:
             return Message.error(f"PC not found: {pc_id}", msg.request_id)
+        data = pc.to_dict()
+        data["summary"] = await self.db.get_pc_summary(pc_id)
         return Message(
             type=MessageType.PC_DATA.value,
-            data=pc.to_dict(),
+            data=data,
             request_id=msg.request_id,
         )
 
     async def _handle_pc_list(self, msg: Message) -> Message:
-        pcs = await self.db.list_pcs()
         return Message(
             type=MessageType.PC_LIST_DATA.value,
-            data={"profiles": [pc.to_dict() for pc in pcs]},
+            data={"profiles": await self.db.list_pc_dicts()},
             request_id=msg.request_id,
         )
 
@@ -136,10 +146,9 @@ class MessageRouter:
 
     async def _handle_session_list(self, msg: Message) -> Message:
         pc_id = msg.data.get("pcId", "")
-        sessions = await self.db.list_sessions(pc_id)
         return Message(
             type=MessageType.SESSION_LIST_DATA.value,
-            data={"pcId": pc_id, "sessions": [s.to_dict() for s in sessions]},
+            data={"pcId": pc_id, "sessions": await self.db.list_session_dicts(pc_id)},
             request_id=msg.request_id,
         )
 
@@ -196,6 +205,7 @@ class MessageRouter:
                                 "durationSeconds": int(old_sm._elapsed_seconds()),
                             },
                         )
+                    await old_sm.close()
                 except Exception:
                     log.exception("Error ending stale session %s", old_sm.session_id)
                 self.server.active_session = None
@@ -208,18 +218,9 @@ class MessageRouter:
             session_id = session.id
 
             # Create and start session manager
-            from ..orchestrator.session_manager import SessionManager, SessionMode
-            session_mode = msg.data.get(
-                "sessionMode", msg.data.get("session_mode", SessionMode.STRUCTURED)
-            )
-            if not isinstance(session_mode, str):
-                session_mode = str(session_mode or "").strip()
-            else:
-                session_mode = session_mode.strip()
-            normalized_session_mode = session_mode.lower()
-            if normalized_session_mode not in (SessionMode.CONVERSATIONAL, SessionMode.STRUCTURED):
-                normalized_session_mode = SessionMode.STRUCTURED
-            session_mode = normalized_session_mode
+            from ..orchestrator.session_manager import SessionManager
+            # SessionManager normalizes the mode (unknown values -> structured)
+            session_mode = msg.data.get("sessionMode", msg.data.get("session_mode"))
             sm = SessionManager(
                 pc_id=pc_id,
                 session_id=session.id,
@@ -227,6 +228,8 @@ class MessageRouter:
                 broadcast_fn=self._broadcast,
                 ai_auditor=self.ai_auditor,
                 session_mode=session_mode,
+                broadcast_many_fn=self._broadcast_many,
+                client_count_fn=self._client_count,
             )
             if self.server:
                 self.server.active_session = sm
@@ -414,8 +417,7 @@ class MessageRouter:
             return Message.error("sessionId and pcId are required", msg.request_id)
 
         try:
-            case_db = await self.db._open_case_db(pc_id)
-            try:
+            async with self.db._case_reader(pc_id) as case_db:
                 # Fetch transcript entries
                 cursor = await case_db.execute(
                     """SELECT turn_number, speaker, text, needle_action, tone_arm, timestamp
@@ -425,17 +427,6 @@ class MessageRouter:
                     (session_id,),
                 )
                 rows = await cursor.fetchall()
-                messages = [
-                    {
-                        "turnNumber": row[0],
-                        "speaker": row[1],
-                        "text": row[2],
-                        "needleAction": row[3],
-                        "toneArm": row[4],
-                        "timestamp": row[5],
-                    }
-                    for row in rows
-                ]
 
                 # Fetch session record for state restoration
                 cursor = await case_db.execute(
@@ -445,22 +436,32 @@ class MessageRouter:
                     (session_id,),
                 )
                 session_row = await cursor.fetchone()
-                session_state = None
-                if session_row:
-                    phase = session_row[0].upper() if session_row[0] else "COMPLETE"
-                    session_state = {
-                        "phase": phase,
-                        "step": "",
-                        "r3rState": None,
-                        "elapsed": session_row[1] or 0,
-                        "isPaused": True,  # recovered sessions start paused
-                        "pcId": pc_id,
-                        "sessionId": session_id,
-                        "currentCommand": "",
-                        "turnNumber": len(messages),
-                    }
-            finally:
-                await case_db.close()
+
+            messages = [
+                {
+                    "turnNumber": row[0],
+                    "speaker": row[1],
+                    "text": row[2],
+                    "needleAction": row[3],
+                    "toneArm": row[4],
+                    "timestamp": row[5],
+                }
+                for row in rows
+            ]
+            session_state = None
+            if session_row:
+                phase = session_row[0].upper() if session_row[0] else "COMPLETE"
+                session_state = {
+                    "phase": phase,
+                    "step": "",
+                    "r3rState": None,
+                    "elapsed": session_row[1] or 0,
+                    "isPaused": True,  # recovered sessions start paused
+                    "pcId": pc_id,
+                    "sessionId": session_id,
+                    "currentCommand": "",
+                    "turnNumber": len(messages),
+                }
         except Exception:
             log.exception("Failed to recover session transcript")
             return Message.error("Failed to recover session", msg.request_id)
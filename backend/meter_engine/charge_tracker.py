@@ -4,6 +4,7 @@ import time
 import logging
 from collections import deque
 from dataclasses import dataclass, field
+from typing import NamedTuple
 
 import numpy as np
 
@@ -25,6 +26,14 @@ class QuestionCharge:
     needle_action_at_peak: str = "idle"
 
 
+class ChargeSnap(NamedTuple):
+    """Latest charge reading, taken once per turn."""
+
+    score: int
+    body_movement: bool
+    analysis: dict | None  # full get_analysis() payload, only when requested
+
+
 class ChargeTracker:
     """Tracks signal changes correlated with auditor questions.
 
@@ -267,6 +276,14 @@ class ChargeTracker:
             "questionHistory": history,
         }
 
+    def snapshot(self, with_analysis: bool = False) -> ChargeSnap:
+        """Latest score and body-movement flag, plus the AI payload if asked for."""
+        analysis = self.get_analysis() if with_analysis else None
+        if not self._questions:
+            return ChargeSnap(0, False, analysis)
+        latest = self._questions[-1]
+        return ChargeSnap(latest.charge_score, latest.body_movement, analysis)
+
     def get_charge_map(self) -> list[dict]:
         """Get the full charge map for session review — all questions with scores."""
         return [
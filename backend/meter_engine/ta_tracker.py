@@ -13,15 +13,40 @@ class TAReading:
 
 
 TA_NOISE_THRESHOLD = 0.001  # Ignore deltas below this
+TREND_WINDOW_S = 60.0  # Window for trend() and the default is_moving()
+WINDOW_RESUM_EVERY = 4096  # Re-derive running sums after this many expiries
 
 
 class TATracker:
-    """Tracks TA position over time for trend analysis and session readiness."""
+    """Tracks TA position over time for trend analysis and session readiness.
 
-    MAX_HISTORY = 30000  # 5 minutes at 100Hz
+    History is decimated to at most one reading per ``min_dt`` seconds
+    (10Hz by default). ``trend()`` and ``is_moving()`` look at 60s windows,
+    so ~600 readings carry the same signal as the raw 6000 at 100Hz; pass
+    ``min_dt=0`` to keep every sample. ``current`` and the session motion
+    totals are still updated on every sample.
+    """
 
-    def __init__(self) -> None:
-        self._history: deque[TAReading] = deque(maxlen=self.MAX_HISTORY)
+    MAX_HISTORY = 30000  # 5 minutes at 100Hz
+    HISTORY_SECONDS = 300.0
+
+    def __init__(self, min_dt: float = 0.1) -> None:
+        self.min_dt = min_dt
+        maxlen = self.MAX_HISTORY
+        if min_dt > 0:
+            maxlen = min(maxlen, int(self.HISTORY_SECONDS / min_dt))
+        self._history: deque[TAReading] = deque(maxlen=maxlen)
+        self._last_history_ts = float("-inf")
+        # Running sums over the last TREND_WINDOW_S of history, with times
+        # taken relative to _window_t0 to keep the sums well conditioned
+        self._window: deque[tuple[float, float]] = deque()  # (timestamp, ta_value)
+        self._window_t0 = 0.0
+        self._sum_t = 0.0
+        self._sum_v = 0.0
+        self._sum_tt = 0.0
+        self._sum_tv = 0.0
+        self._sum_vv = 0.0
+        self._window_expired = 0
         self.current: float = 2.0
         # Cumulative session TA motion
         self._session_start_ta: float | None = None
@@ -30,9 +55,12 @@ class TATracker:
         self._prev_ta: float | None = None
 
     def update(self, ta_value: float, timestamp: float) -> None:
-        """Append a new TA reading."""
+        """Record a new TA reading."""
         self.current = ta_value
-        self._history.append(TAReading(ta_value, timestamp))
+        if timestamp - self._last_history_ts >= self.min_dt:
+            self._history.append(TAReading(ta_value, timestamp))
+            self._last_history_ts = timestamp
+            self._window_add(ta_value, timestamp)
 
         # Accumulate TA motion
         if self._prev_ta is not None:
@@ -69,31 +97,38 @@ class TATracker:
             return False, f"TA too low ({self.current:.2f}), must be >= 1.5"
         return True, "TA in range"
 
-    def is_moving(self, window_seconds: float = 60.0) -> bool:
+    def is_moving(self, window_seconds: float = TREND_WINDOW_S) -> bool:
         """Check if TA has been moving in the recent window."""
         if len(self._history) < 10:
             return False
-        readings = self._recent(window_seconds)
-        if len(readings) < 2:
+        if window_seconds != TREND_WINDOW_S:
+            readings = self._recent(window_seconds)
+            if len(readings) < 2:
+                return False
+            values = [r.ta_value for r in readings]
+            return float(np.std(values)) > 0.05
+
+        n = len(self._window)
+        if n < 2:
             return False
-        values = [r.ta_value for r in readings]
-        return float(np.std(values)) > 0.05
+        mean = self._sum_v / n
+        return self._sum_vv / n - mean * mean > 0.05 * 0.05
 
     def trend(self) -> str:
-        """Determine TA trend over last 60 seconds: RISING, FALLING, or STABLE."""
-        readings = self._recent(60.0)
-        if len(readings) < 10:
-            return "STABLE"
-
-        times = np.array([r.timestamp for r in readings])
-        values = np.array([r.ta_value for r in readings])
+        """Determine TA trend over last 60 seconds: RISING, FALLING, or STABLE.
 
-        # Normalize times to start at 0
-        times = times - times[0]
-        if times[-1] < 1.0:
+        Closed-form least-squares slope from the running window sums.
+        """
+        n = len(self._window)
+        if n < 10:
+            return "STABLE"
+        if self._window[-1][0] - self._window[0][0] < 1.0:
             return "STABLE"
 
-        slope = float(np.polyfit(times, values, 1)[0])
+        denom = n * self._sum_tt - self._sum_t * self._sum_t
+        if denom <= 0.0:
+            return "STABLE"
+        slope = (n * self._sum_tv - self._sum_t * self._sum_v) / denom
 
         if slope > 0.005:
             return "RISING"
@@ -101,6 +136,49 @@ class TATracker:
             return "FALLING"
         return "STABLE"
 
+    def _window_add(self, ta_value: float, timestamp: float) -> None:
+        """Add a reading to the trend window and expire readings older than 60s."""
+        window = self._window
+        if not window:
+            self._window_t0 = timestamp
+        window.append((timestamp, ta_value))
+        t = timestamp - self._window_t0
+        self._sum_t += t
+        self._sum_v += ta_value
+        self._sum_tt += t * t
+        self._sum_tv += t * ta_value
+        self._sum_vv += ta_value * ta_value
+
+        cutoff = timestamp - TREND_WINDOW_S
+        while window[0][0] < cutoff:
+            old_ts, old_v = window.popleft()
+            t = old_ts - self._window_t0
+            self._sum_t -= t
+            self._sum_v -= old_v
+            self._sum_tt -= t * t
+            self._sum_tv -= t * old_v
+            self._sum_vv -= old_v * old_v
+            self._window_expired += 1
+
+        if self._window_expired >= WINDOW_RESUM_EVERY:
+            self._resum_window()
+
+    def _resum_window(self) -> None:
+        """Rebase the window origin and recompute the sums to shed float drift."""
+        t0 = self._window[0][0]
+        sum_t = sum_v = sum_tt = sum_tv = sum_vv = 0.0
+        for ts, v in self._window:
+            t = ts - t0
+            sum_t += t
+            sum_v += v
+            sum_tt += t * t
+            sum_tv += t * v
+            sum_vv += v * v
+        self._window_t0 = t0
+        self._sum_t, self._sum_v = sum_t, sum_v
+        self._sum_tt, self._sum_tv, self._sum_vv = sum_tt, sum_tv, sum_vv
+        self._window_expired = 0
+
     def _recent(self, window_seconds: float) -> list[TAReading]:
         """Get readings from the last N seconds."""
         if not self._history:
@@ -1,34 +1,34 @@
 """R3R state machine — 17 states, 3 flows for auditing processing."""
 
-from enum import Enum
-from dataclasses import dataclass, field
+from enum import IntEnum
+from dataclasses import dataclass
 
 
-class R3RState(Enum):
+class R3RState(IntEnum):
     """17 processing states."""
-    LOCATE_INCIDENT = "LOCATE_INCIDENT"
-    WHAT_HAPPENED = "WHAT_HAPPENED"
-    MOVE_THROUGH = "MOVE_THROUGH"
-    DURATION = "DURATION"
-    BEGINNING = "BEGINNING"
-    MOVE_THROUGH_AGAIN = "MOVE_THROUGH_AGAIN"
-    WHATS_HAPPENING = "WHATS_HAPPENING"
-    ANYTHING_ADDED = "ANYTHING_ADDED"
-    TELL_ME_ABOUT = "TELL_ME_ABOUT"
+    LOCATE_INCIDENT = 0
+    WHAT_HAPPENED = 1
+    MOVE_THROUGH = 2
+    DURATION = 3
+    BEGINNING = 4
+    MOVE_THROUGH_AGAIN = 5
+    WHATS_HAPPENING = 6
+    ANYTHING_ADDED = 7
+    TELL_ME_ABOUT = 8
     # A-B-C-D cycle
-    ABCD_A_RECALL = "ABCD_A_RECALL"
-    ABCD_B_WHEN = "ABCD_B_WHEN"
-    ABCD_C_WHAT_DID_YOU_DO = "ABCD_C_WHAT_DID_YOU_DO"
-    ABCD_D_ANYTHING_ELSE = "ABCD_D_ANYTHING_ELSE"
-    ABCD_ERASING_OR_SOLID = "ABCD_ERASING_OR_SOLID"
+    ABCD_A_RECALL = 9
+    ABCD_B_WHEN = 10
+    ABCD_C_WHAT_DID_YOU_DO = 11
+    ABCD_D_ANYTHING_ELSE = 12
+    ABCD_ERASING_OR_SOLID = 13
     # End phenomena
-    EARLIER_SIMILAR = "EARLIER_SIMILAR"
-    CHAIN_EP = "CHAIN_EP"
-    CHECK_NEXT_FLOW = "CHECK_NEXT_FLOW"
-    ITEM_COMPLETE = "ITEM_COMPLETE"
+    EARLIER_SIMILAR = 14
+    CHAIN_EP = 15
+    CHECK_NEXT_FLOW = 16
+    ITEM_COMPLETE = 17
 
 
-class Flow(Enum):
+class Flow(IntEnum):
     """Three flows of R3R."""
     FLOW_1 = 1  # "to you"
     FLOW_2 = 2  # "you to another"
@@ -42,27 +42,45 @@ FLOW_LABELS = {
     Flow.FLOW_3: "another did to others",
 }
 
-COMMANDS: dict[R3RState, str] = {
-    R3RState.LOCATE_INCIDENT: "Locate an incident of {flow_label}.",
-    R3RState.WHAT_HAPPENED: "What happened?",
-    R3RState.MOVE_THROUGH: "Move through the incident to a point {duration} later.",
-    R3RState.DURATION: "What is the duration of that incident?",
-    R3RState.BEGINNING: "Move to the beginning of that incident.",
-    R3RState.MOVE_THROUGH_AGAIN: "Move through to the end of that incident.",
-    R3RState.WHATS_HAPPENING: "What's happening?",
-    R3RState.ANYTHING_ADDED: "Is anything being added to that incident?",
-    R3RState.TELL_ME_ABOUT: "Tell me about that.",
-    R3RState.ABCD_A_RECALL: "Recall the incident.",
-    R3RState.ABCD_B_WHEN: "When was it?",
-    R3RState.ABCD_C_WHAT_DID_YOU_DO: "What did you do?",
-    R3RState.ABCD_D_ANYTHING_ELSE: "Is there anything else about that incident?",
-    R3RState.ABCD_ERASING_OR_SOLID: "Is that incident erasing or going more solid?",
-    R3RState.EARLIER_SIMILAR: "Is there an earlier similar incident?",
-    R3RState.CHAIN_EP: "How does it seem to you now?",
-    R3RState.CHECK_NEXT_FLOW: "Good. Let's check another flow.",
-    R3RState.ITEM_COMPLETE: "Very good.",
+# Indexed by R3RState ordinal
+COMMANDS: tuple[str, ...] = (
+    "Locate an incident of {flow_label}.",  # LOCATE_INCIDENT
+    "What happened?",  # WHAT_HAPPENED
+    "Move through the incident to a point {duration} later.",  # MOVE_THROUGH
+    "What is the duration of that incident?",  # DURATION
+    "Move to the beginning of that incident.",  # BEGINNING
+    "Move through to the end of that incident.",  # MOVE_THROUGH_AGAIN
+    "What's happening?",  # WHATS_HAPPENING
+    "Is anything being added to that incident?",  # ANYTHING_ADDED
+    "Tell me about that.",  # TELL_ME_ABOUT
+    "Recall the incident.",  # ABCD_A_RECALL
+    "When was it?",  # ABCD_B_WHEN
+    "What did you do?",  # ABCD_C_WHAT_DID_YOU_DO
+    "Is there anything else about that incident?",  # ABCD_D_ANYTHING_ELSE
+    "Is that incident erasing or going more solid?",  # ABCD_ERASING_OR_SOLID
+    "Is there an earlier similar incident?",  # EARLIER_SIMILAR
+    "How does it seem to you now?",  # CHAIN_EP
+    "Good. Let's check another flow.",  # CHECK_NEXT_FLOW
+    "Very good.",  # ITEM_COMPLETE
+)
+
+# LOCATE_INCIDENT only varies by flow, so render it once per flow
+_LOCATE_COMMANDS: dict[Flow, str] = {
+    flow: COMMANDS[R3RState.LOCATE_INCIDENT].format(flow_label=label)
+    for flow, label in FLOW_LABELS.items()
 }
 
+# A-B-C-D successor per R3RState ordinal; -1 where the step isn't a plain advance
+_ABCD_NEXT: tuple[R3RState | int, ...] = tuple(
+    {
+        R3RState.ABCD_A_RECALL: R3RState.ABCD_B_WHEN,
+        R3RState.ABCD_B_WHEN: R3RState.ABCD_C_WHAT_DID_YOU_DO,
+        R3RState.ABCD_C_WHAT_DID_YOU_DO: R3RState.ABCD_D_ANYTHING_ELSE,
+        R3RState.ABCD_D_ANYTHING_ELSE: R3RState.ABCD_ERASING_OR_SOLID,
+    }.get(state, -1)
+    for state in R3RState
+)
+
 # Initial 9-step sequence before A-B-C-D cycling
 INITIAL_SEQUENCE = [
     R3RState.LOCATE_INCIDENT,
@@ -76,8 +94,12 @@ INITIAL_SEQUENCE = [
     R3RState.TELL_ME_ABOUT,
 ]
 
+# Successor of each initial-sequence step (None after the last one)
+_INITIAL_NEXT: tuple[R3RState | None, ...] = tuple(INITIAL_SEQUENCE[1:]) + (None,)
+_INITIAL_IS_DURATION: tuple[bool, ...] = tuple(s == R3RState.DURATION for s in INITIAL_SEQUENCE)
+
 
-@dataclass
+@dataclass(slots=True)
 class R3RContext:
     """Tracks state within the R3R process."""
     current_flow: Flow = Flow.FLOW_1
@@ -86,25 +108,44 @@ class R3RContext:
     fn_detected: bool = False  # floating needle detected
     cognition_noted: bool = False
     vgis_present: bool = False
-    flows_completed: list[Flow] = field(default_factory=list)
+    flows_done_mask: int = 0   # bit (1 << flow.value) set per completed flow
+
+    @property
+    def flows_completed(self) -> list[Flow]:
+        """Completed flows, in flow order."""
+        return [f for f in Flow if self.flows_done_mask & (1 << f.value)]
 
 
 class R3RStateMachine:
     """Drives the R3R auditing process through 17 states and 3 flows."""
 
+    __slots__ = (
+        "state", "ctx", "_initial_step", "_in_initial_sequence",
+        "_duration_value", "_move_through_cached",
+    )
+
     def __init__(self) -> None:
         self.state = R3RState.LOCATE_INCIDENT
         self.ctx = R3RContext()
         self._initial_step = 0  # position in initial 9-step sequence
         self._in_initial_sequence = True
         self._duration_value: str = ""
+        self._on_duration_change()
+
+    def _on_duration_change(self) -> None:
+        """Re-render the MOVE_THROUGH command after the duration changes."""
+        self._move_through_cached = COMMANDS[R3RState.MOVE_THROUGH].format(
+            duration=self._duration_value or "the end"
+        )
 
     def get_command(self) -> str:
         """Get the auditor command text for the current state."""
-        template = COMMANDS.get(self.state, "")
-        flow_label = FLOW_LABELS.get(self.ctx.current_flow, "")
-        duration = self._duration_value or "the end"
-        return template.format(flow_label=flow_label, duration=duration)
+        state = self.state
+        if state == R3RState.MOVE_THROUGH:
+            return self._move_through_cached
+        if state == R3RState.LOCATE_INCIDENT:
+            return _LOCATE_COMMANDS[self.ctx.current_flow]
+        return COMMANDS[state]
 
     def transition(
         self,
@@ -127,36 +168,26 @@ class R3RStateMachine:
 
         # --- Initial 9-step sequence ---
         if self._in_initial_sequence:
-            self._initial_step += 1
-            if self._initial_step < len(INITIAL_SEQUENCE):
-                self.state = INITIAL_SEQUENCE[self._initial_step]
-                # Capture duration for MOVE_THROUGH command
-                if self.state == R3RState.DURATION:
-                    pass  # Will be answered by PC
-                if INITIAL_SEQUENCE[self._initial_step - 1] == R3RState.DURATION:
-                    self._duration_value = pc_response.strip() or "the end"
-            else:
+            nxt = _INITIAL_NEXT[self._initial_step]
+            if nxt is None:
                 # Transition to A-B-C-D cycle
                 self._in_initial_sequence = False
                 self.state = R3RState.ABCD_A_RECALL
+            else:
+                # The step being answered was DURATION — capture it for MOVE_THROUGH
+                if _INITIAL_IS_DURATION[self._initial_step]:
+                    self._duration_value = pc_response.strip() or "the end"
+                    self._on_duration_change()
+                self._initial_step += 1
+                self.state = nxt
             return self.state, self.get_command()
 
         # --- A-B-C-D cycle ---
-        if self.state == R3RState.ABCD_A_RECALL:
-            self.state = R3RState.ABCD_B_WHEN
-            return self.state, self.get_command()
-
-        if self.state == R3RState.ABCD_B_WHEN:
-            self.state = R3RState.ABCD_C_WHAT_DID_YOU_DO
-            return self.state, self.get_command()
-
-        if self.state == R3RState.ABCD_C_WHAT_DID_YOU_DO:
-            self.state = R3RState.ABCD_D_ANYTHING_ELSE
-            return self.state, self.get_command()
-
-        if self.state == R3RState.ABCD_D_ANYTHING_ELSE:
-            self.ctx.abcd_count += 1
-            self.state = R3RState.ABCD_ERASING_OR_SOLID
+        nxt = _ABCD_NEXT[self.state]
+        if nxt != -1:
+            if self.state == R3RState.ABCD_D_ANYTHING_ELSE:
+                self.ctx.abcd_count += 1
+            self.state = nxt
             return self.state, self.get_command()
 
         if self.state == R3RState.ABCD_ERASING_OR_SOLID:
@@ -211,12 +242,12 @@ class R3RStateMachine:
 
     def _check_next_flow(self) -> tuple[R3RState, str]:
         """After EP on current flow, check if more flows needed."""
-        self.ctx.flows_completed.append(self.ctx.current_flow)
+        self.ctx.flows_done_mask |= 1 << self.ctx.current_flow.value
 
-        if self.ctx.current_flow == Flow.FLOW_1 and Flow.FLOW_2 not in self.ctx.flows_completed:
+        if self.ctx.current_flow == Flow.FLOW_1 and not self.ctx.flows_done_mask & (1 << Flow.FLOW_2.value):
             self.state = R3RState.CHECK_NEXT_FLOW
             return self.state, self.get_command()
-        if self.ctx.current_flow == Flow.FLOW_2 and Flow.FLOW_3 not in self.ctx.flows_completed:
+        if self.ctx.current_flow == Flow.FLOW_2 and not self.ctx.flows_done_mask & (1 << Flow.FLOW_3.value):
             self.state = R3RState.CHECK_NEXT_FLOW
             return self.state, self.get_command()
 
@@ -226,9 +257,9 @@ class R3RStateMachine:
 
     def _advance_flow(self) -> tuple[R3RState, str]:
         """Move to the next flow."""
-        if Flow.FLOW_2 not in self.ctx.flows_completed:
+        if not self.ctx.flows_done_mask & (1 << Flow.FLOW_2.value):
             self.ctx.current_flow = Flow.FLOW_2
-        elif Flow.FLOW_3 not in self.ctx.flows_completed:
+        elif not self.ctx.flows_done_mask & (1 << Flow.FLOW_3.value):
             self.ctx.current_flow = Flow.FLOW_3
         else:
             self.state = R3RState.ITEM_COMPLETE
@@ -259,4 +290,5 @@ class R3RStateMachine:
         self._in_initial_sequence = True
         self._initial_step = 0
         self._duration_value = ""
+        self._on_duration_change()
         self.state = R3RState.LOCATE_INCIDENT
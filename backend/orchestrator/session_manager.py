@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import itertools
+import json
 import time
-from datetime import datetime
-from typing import Callable, Awaitable, TYPE_CHECKING
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Callable, Awaitable, NamedTuple, TYPE_CHECKING
 
-from .r3r import R3RStateMachine
-from ..ipc.protocol import Message, MessageType
+from .r3r import R3RState, R3RStateMachine
+from ..ipc.protocol import EncodedMessage, Message, MessageType
 from ..meter_engine.events import MeterEvent, NeedleAction
 
 if TYPE_CHECKING:
@@ -19,43 +22,130 @@ if TYPE_CHECKING:
 log = logging.getLogger("mindscope.session")
 
 
-class SessionMode:
-    STRUCTURED = "structured"
-    CONVERSATIONAL = "conversational"
+def _iso_now() -> str:
+    """UTC wall-clock timestamp, ISO 8601 with millisecond precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
 
 
-class SessionPhase:
-    SETUP = "SETUP"
-    START_RUDIMENTS = "START_RUDIMENTS"
-    PROCESSING = "PROCESSING"
-    END_RUDIMENTS = "END_RUDIMENTS"
-    COMPLETE = "COMPLETE"
+def _iso_from_ns(now_ns: int) -> str:
+    """Format a ``time.time_ns()`` reading like :func:`_iso_now`."""
+    return datetime.fromtimestamp(now_ns / 1e9, tz=timezone.utc).isoformat(
+        timespec="milliseconds"
+    )
+
+
+class SessionMode(IntEnum):
+    STRUCTURED = 0
+    CONVERSATIONAL = 1
+
+
+class SessionPhase(IntEnum):
+    SETUP = 0
+    START_RUDIMENTS = 1
+    PROCESSING = 2
+    END_RUDIMENTS = 3
+    COMPLETE = 4
+
+
+# Wire names, indexed by ordinal (only get_state() and logs need them)
+_MODE_NAME = ("structured", "conversational")
+_PHASE_NAME = tuple(p.name for p in SessionPhase)
+_MODE_BY_NAME = {name: SessionMode(i) for i, name in enumerate(_MODE_NAME)}
+
+
+def _parse_session_mode(value: object) -> SessionMode:
+    """Map a client-supplied mode to SessionMode, defaulting to STRUCTURED."""
+    if isinstance(value, SessionMode):
+        return value
+    return _MODE_BY_NAME.get(str(value or "").strip().lower(), SessionMode.STRUCTURED)
 
 
 # Start rudiments — 4 questions
-START_RUDIMENTS = [
+START_RUDIMENTS = (
     "What are your goals for this session?",
     "Look around the room. Can you have that wall? That ceiling? That floor? Good.",
     "Is there anything you'd like to say to me before we start?",
     "Has anything been suppressed or invalidated since last session?",
-]
+)
 
 # End rudiments — 5 questions
-END_RUDIMENTS = [
+END_RUDIMENTS = (
     "Have your goals for this session been met?",
     "Is there anything you'd like to say to me?",
     "Look around the room. Can you have that wall? That ceiling? That floor? Good.",
     "Has anything been suppressed or invalidated this session?",
     "Is it all right with you if we end this session?",
-]
+)
+
+
+class _RudimentMsg(NamedTuple):
+    text: str
+    # '{"type": ..., "data": {<fixed fields>, ' — the per-turn fields follow
+    json_prefix: str
+
+
+def _rudiment_templates(questions: tuple[str, ...]) -> tuple[_RudimentMsg, ...]:
+    """Pre-encode the fixed part of each rudiment's CHAT_MESSAGE."""
+    return tuple(
+        _RudimentMsg(q, '{"type": %s, "data": %s, ' % (
+            json.dumps(MessageType.CHAT_MESSAGE.value),
+            json.dumps({
+                "speaker": "auditor",
+                "text": q,
+                "needleAction": None,
+                "toneArm": None,
+                "sensitivity": None,
+                "isAiGenerated": False,
+            })[:-1],
+        ))
+        for q in questions
+    )
+
+
+# Per-turn tail of a rudiment message: timestamp, turn, session id (JSON), epoch
+_RUDIMENT_JSON_SUFFIX = (
+    '"timestamp": "%s", "turnNumber": %d, "sessionId": %s, "questionDroppedAt": %r}}'
+)
+
+
+START_RUDIMENT_MSG_TEMPLATES = _rudiment_templates(START_RUDIMENTS)
+END_RUDIMENT_MSG_TEMPLATES = _rudiment_templates(END_RUDIMENTS)
+
+# Key layout of a CHAT_MESSAGE; _broadcast_chat copies it and fills in values
+_CHAT_DATA_TEMPLATE = {
+    "speaker": "",
+    "text": "",
+    "timestamp": "",
+    "turnNumber": 0,
+    "sessionId": "",
+    "needleAction": None,
+    "toneArm": None,
+    "sensitivity": None,
+    "isAiGenerated": False,
+}
 
 
 CONVERSATIONAL_AI_TIMEOUT_SECONDS = 20
 
+# Transcript write-behind: new entries are flushed together after this delay
+PERSIST_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 class SessionManager:
     """Manages the full lifecycle of an auditing session."""
 
+    __slots__ = (
+        "pc_id", "session_id", "_session_id_json", "db",
+        "broadcast_fn", "broadcast_many_fn", "client_count_fn",
+        "ai_auditor", "session_mode", "_phase", "r3r", "_current_command",
+        "turn_number", "_tx_timestamp", "_tx_speaker", "_tx_text",
+        "_tx_needle", "_tx_tone", "_tx_turn", "_outbox", "charge_tracker",
+        "_start_ns", "_pause_start_ns", "_total_paused_ns", "_is_paused",
+        "_rudiment_index", "_state_cache", "_state_cache_turn",
+        "_persist_queue", "_tx_persisted", "_persist_task",
+        "_ai_tasks", "_ai_lock",
+    )
+
     def __init__(
         self,
         pc_id: str,
@@ -63,39 +153,94 @@ class SessionManager:
         db: DatabaseManager,
         broadcast_fn: Callable[[Message], Awaitable[None]],
         ai_auditor: AIAuditor | None = None,
-        session_mode: str = SessionMode.STRUCTURED,
+        session_mode: str | SessionMode = SessionMode.STRUCTURED,
+        broadcast_many_fn: Callable[[list[Message]], Awaitable[None]] | None = None,
+        client_count_fn: Callable[[], int] | None = None,
     ) -> None:
         self.pc_id = pc_id
         self.session_id = session_id
+        self._session_id_json = json.dumps(session_id)
         self.db = db
         self.broadcast_fn = broadcast_fn
+        self.broadcast_many_fn = broadcast_many_fn
+        self.client_count_fn = client_count_fn
         self.ai_auditor = ai_auditor
-        normalized_mode = str(session_mode or "").strip().lower()
-        if normalized_mode not in (SessionMode.STRUCTURED, SessionMode.CONVERSATIONAL):
-            normalized_mode = SessionMode.STRUCTURED
-        self.session_mode = normalized_mode
+        self.session_mode = _parse_session_mode(session_mode)
 
-        self.phase = SessionPhase.SETUP
+        self._phase = SessionPhase.SETUP
         self.r3r = R3RStateMachine()
-        self.current_command = ""
+        self._current_command = ""
         self.turn_number = 0
-        self.transcript: list[dict] = []
+        # In-memory transcript, one list per column
+        self._tx_timestamp: list[str] = []
+        self._tx_speaker: list[str] = []
+        self._tx_text: list[str] = []
+        self._tx_needle: list[str | None] = []
+        self._tx_tone: list[float | None] = []
+        self._tx_turn: list[int] = []
+
+        # Messages queued during a turn, sent together by _flush_broadcasts()
+        self._outbox: list[Message] = []
 
         # Charge tracker (set by router after creation)
         self.charge_tracker = None
 
-        # Timer
-        self._start_time = 0.0
-        self._pause_start = 0.0
-        self._total_paused = 0.0
-        self.is_paused = False
+        # Timer, in integer monotonic nanoseconds (0 = not started)
+        self._start_ns = 0
+        self._pause_start_ns = 0
+        self._total_paused_ns = 0
+        self._is_paused = False
 
         # Rudiment tracking
         self._rudiment_index = 0
 
+        # get_state() memo, dropped when the turn or a state field changes
+        self._state_cache: dict | None = None
+        self._state_cache_turn = -1
+
+        # Transcript persistence: the queue wakes the worker (None stops it)
+        # and _tx_persisted counts the rows already written
+        self._persist_queue: asyncio.Queue[bool | None] = asyncio.Queue()
+        self._tx_persisted = 0
+        self._persist_task: asyncio.Task | None = None
+
+        # In-flight AI responses for structured processing
+        self._ai_tasks: set[asyncio.Task] = set()
+        self._ai_lock = asyncio.Lock()
+
+    @property
+    def phase(self) -> SessionPhase:
+        return self._phase
+
+    @phase.setter
+    def phase(self, value: SessionPhase) -> None:
+        self._phase = value
+        self._state_cache = None
+
+    @property
+    def current_command(self) -> str:
+        return self._current_command
+
+    @current_command.setter
+    def current_command(self, value: str) -> None:
+        self._current_command = value
+        self._state_cache = None
+
+    @property
+    def is_paused(self) -> bool:
+        return self._is_paused
+
+    @is_paused.setter
+    def is_paused(self, value: bool) -> None:
+        self._is_paused = value
+        self._state_cache = None
+
     async def start(self) -> None:
         """Begin the session."""
-        self._start_time = time.monotonic()
+        self._start_ns = time.monotonic_ns()
+        # Keep the case DB open for the whole session
+        self.db.pin_case(self.pc_id)
+        self._persist_task = asyncio.create_task(self._persist_worker())
 
         # Reset AI auditor history for new session
         if self.ai_auditor:
@@ -105,32 +250,43 @@ class SessionManager:
             self.phase = SessionPhase.PROCESSING
             self._rudiment_index = 0
             self.current_command = await self._conversational_opening()
-            self._add_transcript("auditor", self.current_command)
-            await self._persist_entry(self.transcript[-1])
-            await self._broadcast_chat(
-                "auditor", self.current_command, is_ai_generated=bool(self.ai_auditor)
+            timestamp = self._add_transcript("auditor", self.current_command)
+            self._persist_entry()
+            self._broadcast_chat(
+                "auditor", self.current_command,
+                is_ai_generated=bool(self.ai_auditor),
+                timestamp=timestamp,
             )
             log.info("Session %s started in conversational mode for PC %s", self.session_id, self.pc_id)
         else:
             self.phase = SessionPhase.START_RUDIMENTS
             self._rudiment_index = 0
             self.current_command = START_RUDIMENTS[0]
-            self._add_transcript("auditor", self.current_command)
-            await self._persist_entry(self.transcript[-1])
-            await self._broadcast_chat("auditor", self.current_command)
+            timestamp = self._add_transcript("auditor", self.current_command)
+            self._persist_entry()
+            self._broadcast_rudiment(
+                START_RUDIMENT_MSG_TEMPLATES[0], timestamp
+            )
 
-        await self._broadcast_state()
+        self._broadcast_state()
+        await self._flush_broadcasts()
         log.info("Session %s started for PC %s", self.session_id, self.pc_id)
 
     async def end(self) -> None:
         """End the session and persist data."""
+        # Let pending AI responses land before the session closes
+        if self._ai_tasks:
+            await asyncio.gather(*self._ai_tasks, return_exceptions=True)
+
         if self.session_mode == SessionMode.CONVERSATIONAL:
             closing = await self._conversational_closing()
             self.current_command = closing
-            self._add_transcript("auditor", closing)
-            await self._persist_entry(self.transcript[-1])
-            await self._broadcast_chat(
-                "auditor", closing, is_ai_generated=bool(self.ai_auditor)
+            timestamp = self._add_transcript("auditor", closing)
+            self._persist_entry()
+            self._broadcast_chat(
+                "auditor", closing,
+                is_ai_generated=bool(self.ai_auditor),
+                timestamp=timestamp,
             )
 
         self.phase = SessionPhase.COMPLETE
@@ -142,20 +298,37 @@ class SessionManager:
             "durationSeconds": int(elapsed),
         })
 
-        # Transcript entries already persisted individually via _persist_entry
+        # Transcript entries are flushed by the persistence worker in close()
 
         # Broadcast charge map in conversational mode
         if self.session_mode == SessionMode.CONVERSATIONAL and self.charge_tracker:
             charge_map = self.charge_tracker.get_charge_map()
             if charge_map:
-                await self.broadcast_fn(Message(
+                self._outbox.append(Message(
                     type=MessageType.CHARGE_MAP.value,
                     data={"entries": charge_map, "sessionId": self.session_id},
                 ))
 
-        await self._broadcast_state()
+        self._broadcast_state()
+        await self._flush_broadcasts()
+        await self.close()
         log.info("Session %s ended (%.0fs)", self.session_id, elapsed)
 
+    async def close(self) -> None:
+        """Cancel pending AI work and flush queued transcript entries."""
+        for ai_task in self._ai_tasks:
+            ai_task.cancel()
+        if self._ai_tasks:
+            await asyncio.gather(*self._ai_tasks, return_exceptions=True)
+
+        task, self._persist_task = self._persist_task, None
+        if task is not None:
+            try:
+                self._persist_queue.put_nowait(None)
+                await task
+            finally:
+                self.db.unpin_case(self.pc_id)
+
     async def _conversational_opening(self) -> str:
         """Generate the initial conversational opening from the AI auditor."""
         pc_name = "this person"
@@ -198,13 +371,13 @@ class SessionManager:
         """Pause the session timer."""
         if not self.is_paused:
             self.is_paused = True
-            self._pause_start = time.monotonic()
+            self._pause_start_ns = time.monotonic_ns()
             log.info("Session %s paused", self.session_id)
 
     def resume(self) -> None:
         """Resume the session timer."""
         if self.is_paused:
-            self._total_paused += time.monotonic() - self._pause_start
+            self._total_paused_ns += time.monotonic_ns() - self._pause_start_ns
             self.is_paused = False
             log.info("Session %s resumed", self.session_id)
 
@@ -219,27 +392,34 @@ class SessionManager:
         needle_action = meter_event.needle_action if meter_event else None
         tone_arm = meter_event.tone_arm if meter_event else None
         sensitivity = meter_event.sensitivity if meter_event else None
+        # Only the AI auditor consumes the dict form of the meter reading
+        meter_data = meter_event.to_dict() if meter_event and self.ai_auditor else None
 
-        # Get charge analysis before advancing (for PC's message display)
+        # Get charge analysis before advancing (for PC's message display);
+        # the full payload is only needed by the conversational AI
         charge_score = None
         body_movement = None
+        charge_data = None
         if self.charge_tracker:
-            charge_analysis = self.charge_tracker.get_analysis()
-            charge_score = charge_analysis.get("chargeScore", 0)
-            body_movement = charge_analysis.get("bodyMovement", False)
+            snap = self.charge_tracker.snapshot(
+                with_analysis=self.session_mode == SessionMode.CONVERSATIONAL
+                and self.ai_auditor is not None,
+            )
+            charge_score, body_movement, charge_data = snap
 
         # Record PC's response
-        self._add_transcript("pc", text, needle_action, tone_arm)
-        await self._persist_entry(self.transcript[-1])
+        timestamp = self._add_transcript("pc", text, needle_action, tone_arm)
+        self._persist_entry()
 
         # Broadcast PC chat message (server echo — frontend waits for this)
-        await self._broadcast_chat(
+        self._broadcast_chat(
             "pc", text,
             needle_action=needle_action.value if needle_action else None,
             tone_arm=tone_arm,
             sensitivity=sensitivity,
             charge_score=charge_score,
             body_movement=body_movement,
+            timestamp=timestamp,
         )
 
         # Conversational mode is always AI-driven processing only.
@@ -254,13 +434,14 @@ class SessionManager:
             await self._advance_start_rudiments(text, meter_event)
         elif self.phase == SessionPhase.PROCESSING:
             if self.session_mode == SessionMode.CONVERSATIONAL:
-                await self._advance_conversational(text, meter_event)
+                await self._advance_conversational(text, meter_data, charge_data)
             else:
-                await self._advance_processing(text, meter_event)
+                await self._advance_processing(text, meter_event, meter_data)
         elif self.phase == SessionPhase.END_RUDIMENTS:
             await self._advance_end_rudiments(text, meter_event)
 
-        await self._broadcast_state()
+        self._broadcast_state()
+        await self._flush_broadcasts()
         return self.get_state()
 
     async def _advance_start_rudiments(
@@ -268,8 +449,10 @@ class SessionManager:
     ) -> None:
         """Advance through start rudiments."""
         self._rudiment_index += 1
+        template = None
         if self._rudiment_index < len(START_RUDIMENTS):
             self.current_command = START_RUDIMENTS[self._rudiment_index]
+            template = START_RUDIMENT_MSG_TEMPLATES[self._rudiment_index]
         else:
             # Transition to processing
             self.phase = SessionPhase.PROCESSING
@@ -277,12 +460,17 @@ class SessionManager:
             self.current_command = self.r3r.get_command()
             log.info("Session %s entering PROCESSING phase", self.session_id)
 
-        self._add_transcript("auditor", self.current_command)
-        await self._persist_entry(self.transcript[-1])
-        await self._broadcast_chat("auditor", self.current_command)
+        timestamp = self._add_transcript("auditor", self.current_command)
+        self._persist_entry()
+        if template is not None:
+            self._broadcast_rudiment(template, timestamp)
+        else:
+            self._broadcast_chat(
+                "auditor", self.current_command, timestamp=timestamp
+            )
 
     async def _advance_processing(
-        self, text: str, meter: MeterEvent | None
+        self, text: str, meter: MeterEvent | None, meter_data: dict | None = None
     ) -> None:
         """Advance the R3R state machine, optionally using AI for response."""
         fn_detected = False
@@ -294,48 +482,91 @@ class SessionManager:
             fn_detected=fn_detected,
         )
 
-        # Try AI auditor for natural language response
-        is_ai = False
+        self.current_command = command
+        # The auditor row goes in now, right after the PC's answer, so the
+        # stored order matches the conversation even when the AI is slow
+        timestamp = self._add_transcript("auditor", command)
+        self._persist_entry()
         if self.ai_auditor:
-            try:
-                meter_data = meter.to_dict() if meter else None
-                session_info = self.get_state()
-                ai_response = await self.ai_auditor.respond(
+            # Send the R3R command now and let the AI phrasing replace it
+            # when it arrives, so the LLM round-trip never blocks the turn
+            self._broadcast_chat("auditor", command, timestamp=timestamp, pending=True)
+            task = asyncio.create_task(self._resolve_ai(
+                text, new_state, command, self.turn_number, meter_data, self.get_state(),
+                len(self._tx_turn) - 1,
+            ))
+            self._ai_tasks.add(task)
+            task.add_done_callback(self._ai_tasks.discard)
+        else:
+            self._broadcast_chat("auditor", command, timestamp=timestamp)
+
+        # Broadcast state change
+        self._outbox.append(Message(
+            type=MessageType.STATE_CHANGE.value,
+            data={"r3rState": new_state.name, "command": command},
+        ))
+
+    async def _resolve_ai(
+        self,
+        text: str,
+        new_state: R3RState,
+        command: str,
+        turn_number: int,
+        meter_data: dict | None,
+        session_info: dict,
+        entry_index: int,
+    ) -> None:
+        """Get the AI phrasing for a turn and send it as a replacement message.
+
+        entry_index is the transcript entry already holding the R3R command;
+        its text is swapped for the AI response.
+        """
+        is_ai = False
+        response = command
+        try:
+            # One request at a time keeps the auditor's history in turn order
+            async with self._ai_lock:
+                response = await self.ai_auditor.respond(
                     pc_text=text,
-                    r3r_state=new_state.value,
+                    r3r_state=new_state.name,
                     r3r_command=command,
                     meter_data=meter_data,
                     session_info=session_info,
                 )
-                self.current_command = ai_response
-                is_ai = True
-            except Exception:
-                log.exception("AI auditor error, falling back to R3R command")
-                self.current_command = command
-        else:
-            self.current_command = command
-
-        self._add_transcript("auditor", self.current_command)
-        await self._persist_entry(self.transcript[-1])
-        await self._broadcast_chat("auditor", self.current_command, is_ai_generated=is_ai)
+            is_ai = True
+        except Exception:
+            log.exception("AI auditor error, falling back to R3R command")
 
-        # Broadcast state change
-        await self.broadcast_fn(Message(
-            type=MessageType.STATE_CHANGE.value,
-            data={"r3rState": new_state.value, "command": command},
+        timestamp = self._tx_timestamp[entry_index]
+        self._outbox.append(Message(
+            type=MessageType.CHAT_MESSAGE.value,
+            data={
+                "speaker": "auditor",
+                "text": response,
+                "timestamp": timestamp,
+                "turnNumber": turn_number,
+                "sessionId": self.session_id,
+                "isAiGenerated": is_ai,
+                "replaceTurn": turn_number,
+            },
         ))
+        if turn_number == self.turn_number:
+            self.current_command = response
+            self._broadcast_state()
+        await self._flush_broadcasts()
+        if response != command:
+            await self._replace_entry_text(entry_index, response)
 
     async def _advance_conversational(
-        self, text: str, meter: MeterEvent | None
+        self,
+        text: str,
+        meter_data: dict | None = None,
+        charge_data: dict | None = None,
     ) -> None:
         """Advance in conversational mode — free-form AI chat with charge data."""
         is_ai = False
-        charge_data = None
-        if self.charge_tracker:
-            charge_data = self.charge_tracker.get_analysis()
-
-        meter_data = meter.to_dict() if meter else None
         session_info = self.get_state()
+        await self._flush_broadcasts()
         self.current_command = await self._generate_conversational_response(
             text,
             default="Thank you. Tell me more about that.",
@@ -346,9 +577,13 @@ class SessionManager:
         # Flag as AI-generated only if it didn't use the default fallback text.
         is_ai = self.current_command != "Thank you. Tell me more about that."
 
-        self._add_transcript("auditor", self.current_command)
-        await self._persist_entry(self.transcript[-1])
-        await self._broadcast_chat("auditor", self.current_command, is_ai_generated=is_ai)
+        timestamp = self._add_transcript("auditor", self.current_command)
+        self._persist_entry()
+        self._broadcast_chat(
+            "auditor", self.current_command,
+            is_ai_generated=is_ai,
+            timestamp=timestamp,
+        )
 
     async def _generate_conversational_response(
         self,
@@ -379,7 +614,7 @@ class SessionManager:
         except asyncio.TimeoutError:
             log.warning(
                 "Conversational AI request timed out for session %s (sessionId %s)",
-                self.session_mode,
+                _MODE_NAME[self.session_mode],
                 self.session_id,
             )
             return default
@@ -392,15 +627,22 @@ class SessionManager:
     ) -> None:
         """Advance through end rudiments."""
         self._rudiment_index += 1
+        template = None
         if self._rudiment_index < len(END_RUDIMENTS):
             self.current_command = END_RUDIMENTS[self._rudiment_index]
+            template = END_RUDIMENT_MSG_TEMPLATES[self._rudiment_index]
         else:
             self.current_command = "That is the end of this session. Thank you."
             self.phase = SessionPhase.COMPLETE
 
-        self._add_transcript("auditor", self.current_command)
-        await self._persist_entry(self.transcript[-1])
-        await self._broadcast_chat("auditor", self.current_command)
+        timestamp = self._add_transcript("auditor", self.current_command)
+        self._persist_entry()
+        if template is not None:
+            self._broadcast_rudiment(template, timestamp)
+        else:
+            self._broadcast_chat(
+                "auditor", self.current_command, timestamp=timestamp
+            )
 
     def start_end_rudiments(self) -> None:
         """Transition from processing to end rudiments."""
@@ -413,29 +655,39 @@ class SessionManager:
         self._add_transcript("auditor", self.current_command)
 
     def get_state(self) -> dict:
-        """Get current session state as a dict for broadcasting."""
-        return {
-            "phase": self.phase,
+        """Get current session state as a dict for broadcasting.
+
+        The dict is memoized for the current turn (elapsed is stamped when it
+        is built), so callers must not mutate it.
+        """
+        state = self._state_cache
+        if state is not None and self._state_cache_turn == self.turn_number:
+            return state
+        state = {
+            "phase": _PHASE_NAME[self.phase],
             "step": self.current_command,
-            "r3rState": self.r3r.state.value if self.phase == SessionPhase.PROCESSING and self.session_mode == SessionMode.STRUCTURED else None,
+            "r3rState": self.r3r.state.name if self.phase == SessionPhase.PROCESSING and self.session_mode == SessionMode.STRUCTURED else None,
             "elapsed": self._elapsed_seconds(),
             "isPaused": self.is_paused,
             "pcId": self.pc_id,
             "sessionId": self.session_id,
             "currentCommand": self.current_command,
             "turnNumber": self.turn_number,
-            "sessionMode": self.session_mode,
+            "sessionMode": _MODE_NAME[self.session_mode],
         }
+        self._state_cache = state
+        self._state_cache_turn = self.turn_number
+        return state
 
     def _elapsed_seconds(self) -> float:
         """Get elapsed session time, excluding paused periods."""
-        if self._start_time == 0:
+        if self._start_ns == 0:
             return 0.0
-        now = time.monotonic()
-        paused = self._total_paused
+        now_ns = time.monotonic_ns()
+        paused_ns = self._total_paused_ns
         if self.is_paused:
-            paused += now - self._pause_start
-        return now - self._start_time - paused
+            paused_ns += now_ns - self._pause_start_ns
+        return (now_ns - self._start_ns - paused_ns) / 1e9
 
     def _add_transcript(
         self,
@@ -443,38 +695,89 @@ class SessionManager:
         text: str,
         needle_action: NeedleAction | None = None,
         tone_arm: float | None = None,
-    ) -> None:
-        """Add an entry to the in-memory transcript."""
-        entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "speaker": speaker,
-            "text": text,
-            "needleAction": needle_action.value if needle_action else None,
-            "toneArm": tone_arm,
-            "turnNumber": self.turn_number,
-        }
-        self.transcript.append(entry)
+        turn_number: int | None = None,
+    ) -> str:
+        """Add an entry to the in-memory transcript and return its timestamp."""
+        timestamp = _iso_now()
+        self._tx_timestamp.append(timestamp)
+        self._tx_speaker.append(speaker)
+        self._tx_text.append(text)
+        self._tx_needle.append(needle_action.value if needle_action else None)
+        self._tx_tone.append(tone_arm)
+        self._tx_turn.append(self.turn_number if turn_number is None else turn_number)
+        return timestamp
+
+    def _transcript_rows(self, start: int, end: int):
+        """transcript_entries rows for transcript[start:end], in INSERT column order."""
+        return zip(
+            itertools.repeat(self.session_id, end - start),
+            self._tx_turn[start:end],
+            self._tx_speaker[start:end],
+            self._tx_text[start:end],
+            self._tx_needle[start:end],
+            self._tx_tone[start:end],
+            self._tx_timestamp[start:end],
+        )
+
+    def _persist_entry(self) -> None:
+        """Wake the persistence worker for newly added transcript entries.
+
+        Never awaits the write. The worker writes every entry past
+        _tx_persisted, so one pending wake-up is enough however many
+        entries a turn adds.
+        """
+        if self._persist_queue.empty():
+            self._persist_queue.put_nowait(True)
+
+    async def _persist_worker(self) -> None:
+        """Write new transcript entries to the case DB in batches."""
+        queue = self._persist_queue
+        stopping = False
+        while not stopping:
+            if await queue.get() is None:
+                stopping = True
+            else:
+                # Give the rest of the turn a moment to land in the same batch
+                await asyncio.sleep(PERSIST_FLUSH_INTERVAL_SECONDS)
+                while not queue.empty():
+                    if queue.get_nowait() is None:
+                        stopping = True
+            await self._write_pending_entries()
+
+    async def _replace_entry_text(self, index: int, text: str) -> None:
+        """Swap the text of a transcript entry, in the DB too if already written.
+
+        An entry past _tx_persisted picks the new text up when it is flushed.
+        A flushed one is updated in place; its INSERT took the case write
+        lock first, so the UPDATE always lands after it.
+        """
+        self._tx_text[index] = text
+        if index >= self._tx_persisted:
+            return
+        try:
+            await self.db.update_transcript_text(
+                self.pc_id, self.session_id, self._tx_turn[index],
+                self._tx_speaker[index], self._tx_timestamp[index], text,
+            )
+        except Exception:
+            log.exception("Failed to update transcript entry %d", index)
 
-    async def _persist_entry(self, entry: dict) -> None:
-        """Persist a single transcript entry immediately."""
+    async def _write_pending_entries(self) -> None:
+        """Insert transcript entries not yet persisted with a single commit."""
+        start, end = self._tx_persisted, len(self._tx_turn)
+        if start == end:
+            return
+        self._tx_persisted = end
         try:
-            case_db = await self.db._open_case_db(self.pc_id)
-            try:
-                await case_db.execute(
-                    """INSERT OR IGNORE INTO transcript_entries
-                       (session_id, turn_number, speaker, text, needle_action, tone_arm, timestamp)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    (self.session_id, entry["turnNumber"], entry["speaker"],
-                     entry["text"], entry["needleAction"], entry["toneArm"],
-                     entry["timestamp"]),
-                )
-                await case_db.commit()
-            finally:
-                await case_db.close()
+            # Goes through the manager's case writer so it can't interleave
+            # with session updates from the router
+            await self.db.add_transcript_entries(
+                self.pc_id, self._transcript_rows(start, end),
+            )
         except Exception:
-            log.exception("Failed to persist transcript entry")
+            log.exception("Failed to persist %d transcript entries", end - start)
 
-    async def _broadcast_chat(
+    def _broadcast_chat(
         self,
         speaker: str,
         text: str,
@@ -484,73 +787,85 @@ class SessionManager:
         is_ai_generated: bool = False,
         charge_score: int | None = None,
         body_movement: bool | None = None,
+        timestamp: str | None = None,
+        pending: bool = False,
     ) -> None:
-        """Broadcast a CHAT_MESSAGE to all clients."""
-        data: dict = {
-            "speaker": speaker,
-            "text": text,
-            "timestamp": datetime.utcnow().isoformat(),
-            "turnNumber": self.turn_number,
-            "sessionId": self.session_id,
-            "needleAction": needle_action,
-            "toneArm": tone_arm,
-            "sensitivity": sensitivity,
-            "isAiGenerated": is_ai_generated,
-        }
+        """Queue a CHAT_MESSAGE for all clients."""
+        # Notify charge tracker about the question being dropped
+        if speaker == "auditor" and self.charge_tracker:
+            self.charge_tracker.question_dropped(text)
+        if not self._has_clients():
+            return
+        # One clock read covers both the ISO timestamp and questionDroppedAt
+        now_ns = time.time_ns()
+        data = _CHAT_DATA_TEMPLATE.copy()
+        data["speaker"] = speaker
+        data["text"] = text
+        data["timestamp"] = timestamp or _iso_from_ns(now_ns)
+        data["turnNumber"] = self.turn_number
+        data["sessionId"] = self.session_id
+        if needle_action is not None:
+            data["needleAction"] = needle_action
+        if tone_arm is not None:
+            data["toneArm"] = tone_arm
+        if sensitivity is not None:
+            data["sensitivity"] = sensitivity
+        if is_ai_generated:
+            data["isAiGenerated"] = True
         # Include charge data if present
         if charge_score is not None:
             data["chargeScore"] = charge_score
         if body_movement is not None:
             data["bodyMovement"] = body_movement
+        # Placeholder to be replaced by a later message with replaceTurn
+        if pending:
+            data["pending"] = True
         # Mark auditor questions with epoch timestamp for signal chart markers
         if speaker == "auditor":
-            data["questionDroppedAt"] = time.time()
-            # Notify charge tracker about the question being dropped
-            if self.charge_tracker:
-                self.charge_tracker.question_dropped(text)
-        await self.broadcast_fn(Message(
+            data["questionDroppedAt"] = now_ns / 1e9
+        self._outbox.append(Message(
             type=MessageType.CHAT_MESSAGE.value,
             data=data,
         ))
 
-    async def _broadcast_state(self) -> None:
-        """Broadcast current session state to all clients."""
+    def _broadcast_rudiment(self, template: _RudimentMsg, timestamp: str) -> None:
+        """Queue a CHAT_MESSAGE for a fixed rudiment question."""
+        if self.charge_tracker:
+            self.charge_tracker.question_dropped(template.text)
+        if not self._has_clients():
+            return
+        # Only the per-turn tail is encoded here; timestamp comes from
+        # _iso_now() and needs no escaping
+        self._outbox.append(EncodedMessage(
+            type=MessageType.CHAT_MESSAGE.value,
+            encoded=template.json_prefix + _RUDIMENT_JSON_SUFFIX % (
+                timestamp, self.turn_number, self._session_id_json, time.time(),
+            ),
+        ))
+
+    def _broadcast_state(self) -> None:
+        """Queue the current session state for all clients."""
+        if not self._has_clients():
+            return
         state = self.get_state()
-        await self.broadcast_fn(Message(
+        self._outbox.append(Message(
             type=MessageType.SESSION_STATE.value,
             data=state,
         ))
 
-        # Also broadcast latest transcript entry
-        if self.transcript:
-            await self.broadcast_fn(Message(
-                type=MessageType.TRANSCRIPT_UPDATE.value,
-                data={"entry": self.transcript[-1]},
-            ))
+    def _has_clients(self) -> bool:
+        """Whether anyone is listening (assumed so when no counter is wired)."""
+        return self.client_count_fn is None or self.client_count_fn() > 0
 
-    async def _persist_transcript(self) -> None:
-        """Save transcript entries to the per-PC case database."""
-        try:
-            case_db = await self.db._open_case_db(self.pc_id)
-            try:
-                for entry in self.transcript:
-                    await case_db.execute(
-                        """INSERT INTO transcript_entries
-                           (session_id, turn_number, speaker, text, needle_action, tone_arm, timestamp)
-                           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            self.session_id,
-                            entry["turnNumber"],
-                            entry["speaker"],
-                            entry["text"],
-                            entry["needleAction"],
-                            entry["toneArm"],
-                            entry["timestamp"],
-                        ),
-                    )
-                await case_db.commit()
-            finally:
-                await case_db.close()
-            log.info("Persisted %d transcript entries", len(self.transcript))
-        except Exception:
-            log.exception("Failed to persist transcript")
+    async def _flush_broadcasts(self) -> None:
+        """Send all queued messages in one fan-out."""
+        if not self._outbox:
+            return
+        msgs, self._outbox = self._outbox, []
+        if not self._has_clients():
+            return
+        if self.broadcast_many_fn:
+            await self.broadcast_many_fn(msgs)
+            return
+        for msg in msgs:
+            await self.broadcast_fn(msg)
@@ -6,16 +6,40 @@ Two-tier storage:
 """
 
 import os
+import asyncio
+import itertools
+import shutil
+import time
 import aiosqlite
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterable
 
-from .models import PCModel, SessionRecord, CaseStatus
+from .models import (
+    PCModel, SessionRecord, SessionPhase, CaseStatus, from_epoch_ms,
+)
 
 MINDSCOPE_DIR = Path.home() / ".mindscope"
 CENTRAL_DB = MINDSCOPE_DIR / "mindscope.db"
 CASE_FOLDERS = MINDSCOPE_DIR / "case_folders"
 
+# Applied to every connection when it is opened. WAL + synchronous=NORMAL
+# only fsyncs at checkpoints; a desktop app can afford that trade.
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=5000;
+PRAGMA foreign_keys=ON;
+"""
+
+# Stored in PRAGMA user_version once a DB's schema is in place. Bump it when
+# CENTRAL_SCHEMA or CASE_SCHEMA changes so existing files re-run the script.
+SCHEMA_VERSION = 2
+
 # --- Central Index Schema ---
 
 CENTRAL_SCHEMA = """
@@ -26,9 +50,10 @@ CREATE TABLE IF NOT EXISTS pc_profiles (
     case_status TEXT NOT NULL DEFAULT 'active',
     current_grade TEXT NOT NULL DEFAULT '',
     notes TEXT NOT NULL DEFAULT '',
-    created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
 );
+CREATE INDEX IF NOT EXISTS idx_pc_profiles_updated ON pc_profiles(updated_at DESC);
 """
 
 # --- Per-PC Case Schema (12 tables) ---
@@ -45,9 +70,10 @@ CREATE TABLE IF NOT EXISTS sessions (
     ta_motion REAL NOT NULL DEFAULT 0.0,
     indicators TEXT NOT NULL DEFAULT '',
     notes TEXT NOT NULL DEFAULT '',
-    created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
 );
+CREATE INDEX IF NOT EXISTS idx_sessions_pc_num ON sessions(pc_id, session_number DESC);
 
 CREATE TABLE IF NOT EXISTS transcript_entries (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -60,6 +86,7 @@ CREATE TABLE IF NOT EXISTS transcript_entries (
     timestamp TEXT NOT NULL,
     FOREIGN KEY (session_id) REFERENCES sessions(id)
 );
+CREATE INDEX IF NOT EXISTS idx_transcript_session ON transcript_entries(session_id);
 
 CREATE TABLE IF NOT EXISTS meter_readings (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -81,6 +108,7 @@ CREATE TABLE IF NOT EXISTS cognitions (
     timestamp TEXT NOT NULL,
     FOREIGN KEY (session_id) REFERENCES sessions(id)
 );
+CREATE INDEX IF NOT EXISTS idx_cognitions_session ON cognitions(session_id);
 
 CREATE TABLE IF NOT EXISTS items (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -93,6 +121,7 @@ CREATE TABLE IF NOT EXISTS items (
     timestamp TEXT NOT NULL,
     FOREIGN KEY (session_id) REFERENCES sessions(id)
 );
+CREATE INDEX IF NOT EXISTS idx_items_session ON items(session_id);
 
 CREATE TABLE IF NOT EXISTS chains (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -104,6 +133,7 @@ CREATE TABLE IF NOT EXISTS chains (
     timestamp TEXT NOT NULL,
     FOREIGN KEY (session_id) REFERENCES sessions(id)
 );
+CREATE INDEX IF NOT EXISTS idx_chains_session ON chains(session_id);
 
 CREATE TABLE IF NOT EXISTS cs_programs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -114,6 +144,7 @@ CREATE TABLE IF NOT EXISTS cs_programs (
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL
 );
+CREATE INDEX IF NOT EXISTS idx_cs_programs_pc ON cs_programs(pc_id, priority);
 
 CREATE TABLE IF NOT EXISTS cs_reviews (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -123,6 +154,7 @@ CREATE TABLE IF NOT EXISTS cs_reviews (
     created_at TEXT NOT NULL,
     FOREIGN KEY (session_id) REFERENCES sessions(id)
 );
+CREATE INDEX IF NOT EXISTS idx_cs_reviews_session ON cs_reviews(session_id);
 
 CREATE TABLE IF NOT EXISTS exam_results (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -134,6 +166,7 @@ CREATE TABLE IF NOT EXISTS exam_results (
     created_at TEXT NOT NULL,
     FOREIGN KEY (session_id) REFERENCES sessions(id)
 );
+CREATE INDEX IF NOT EXISTS idx_exam_results_session ON exam_results(session_id);
 
 CREATE TABLE IF NOT EXISTS tone_readings (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -142,6 +175,7 @@ CREATE TABLE IF NOT EXISTS tone_readings (
     tone_name TEXT NOT NULL DEFAULT '',
     timestamp TEXT NOT NULL
 );
+CREATE INDEX IF NOT EXISTS idx_tone_session ON tone_readings(session_id);
 
 CREATE TABLE IF NOT EXISTS emotion_snapshots (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -152,6 +186,7 @@ CREATE TABLE IF NOT EXISTS emotion_snapshots (
     prosody_json TEXT NOT NULL DEFAULT '{}',
     timestamp TEXT NOT NULL
 );
+CREATE INDEX IF NOT EXISTS idx_emotion_session ON emotion_snapshots(session_id);
 
 CREATE TABLE IF NOT EXISTS grade_completions (
     id TEXT PRIMARY KEY,
@@ -162,28 +197,312 @@ CREATE TABLE IF NOT EXISTS grade_completions (
     completed_at TEXT DEFAULT NULL,
     notes TEXT NOT NULL DEFAULT ''
 );
+CREATE INDEX IF NOT EXISTS idx_grade_pc ON grade_completions(pc_id);
+
+-- Session rollup per PC, kept current by the triggers below so readers
+-- do one keyed lookup instead of aggregating sessions
+CREATE TABLE IF NOT EXISTS pc_summary (
+    pc_id TEXT PRIMARY KEY,
+    session_count INTEGER NOT NULL DEFAULT 0,
+    last_session_at INTEGER DEFAULT NULL,
+    total_duration INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO pc_summary (pc_id, session_count, last_session_at, total_duration)
+    SELECT pc_id, COUNT(*), MAX(created_at), SUM(duration_seconds)
+    FROM sessions GROUP BY pc_id;
+
+CREATE TRIGGER IF NOT EXISTS trg_sessions_ai AFTER INSERT ON sessions BEGIN
+    INSERT INTO pc_summary (pc_id, session_count, last_session_at, total_duration)
+    VALUES (NEW.pc_id, 1, NEW.created_at, NEW.duration_seconds)
+    ON CONFLICT(pc_id) DO UPDATE SET
+        session_count = session_count + 1,
+        last_session_at = MAX(COALESCE(last_session_at, 0), excluded.last_session_at),
+        total_duration = total_duration + excluded.total_duration;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sessions_au AFTER UPDATE OF duration_seconds ON sessions BEGIN
+    UPDATE pc_summary
+    SET total_duration = total_duration - OLD.duration_seconds + NEW.duration_seconds
+    WHERE pc_id = NEW.pc_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sessions_ad AFTER DELETE ON sessions BEGIN
+    UPDATE pc_summary
+    SET session_count = session_count - 1,
+        total_duration = total_duration - OLD.duration_seconds,
+        last_session_at = (SELECT MAX(created_at) FROM sessions WHERE pc_id = OLD.pc_id)
+    WHERE pc_id = OLD.pc_id;
+END;
 """
 
+# --- Upgrades, keyed by the version they start from ---
+#
+# Each runs inside _migrate()'s transaction ahead of the schema script, which
+# then recreates anything an upgrade dropped (indexes, triggers, pc_summary).
+
+# v1 -> v2: pc_profiles/sessions created_at/updated_at go from isoformat()
+# TEXT to INTEGER epoch milliseconds. SQLite can't change a column's type in
+# place, so the tables are rebuilt.
+_ISO_TO_MS = "CAST(ROUND((julianday({col}) - 2440587.5) * 86400000) AS INTEGER)"
+
+CENTRAL_UPGRADES = {
+    1: f"""
+CREATE TABLE pc_profiles_v2 (
+    id TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL DEFAULT '',
+    last_name TEXT NOT NULL DEFAULT '',
+    case_status TEXT NOT NULL DEFAULT 'active',
+    current_grade TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+INSERT INTO pc_profiles_v2
+    SELECT id, first_name, last_name, case_status, current_grade, notes,
+        {_ISO_TO_MS.format(col="created_at")}, {_ISO_TO_MS.format(col="updated_at")}
+    FROM pc_profiles;
+DROP TABLE pc_profiles;
+ALTER TABLE pc_profiles_v2 RENAME TO pc_profiles;
+""",
+}
+
+CASE_UPGRADES = {
+    1: f"""
+CREATE TABLE sessions_v2 (
+    id TEXT PRIMARY KEY,
+    pc_id TEXT NOT NULL,
+    phase TEXT NOT NULL DEFAULT 'setup',
+    session_number INTEGER NOT NULL DEFAULT 0,
+    duration_seconds INTEGER NOT NULL DEFAULT 0,
+    ta_start REAL NOT NULL DEFAULT 0.0,
+    ta_end REAL NOT NULL DEFAULT 0.0,
+    ta_motion REAL NOT NULL DEFAULT 0.0,
+    indicators TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+INSERT INTO sessions_v2
+    SELECT id, pc_id, phase, session_number, duration_seconds, ta_start,
+        ta_end, ta_motion, indicators, notes,
+        {_ISO_TO_MS.format(col="created_at")}, {_ISO_TO_MS.format(col="updated_at")}
+    FROM sessions;
+DROP TABLE sessions;
+ALTER TABLE sessions_v2 RENAME TO sessions;
+DROP TABLE IF EXISTS pc_summary;
+""",
+}
+
+# --- Partial updates: camelCase update key -> (column, coercion) ---
+#
+# Enum fields are validated up front; text fields have no coercion, so a
+# value of the wrong type still fails in the driver instead of being stored
+# as its repr.
+
+_FieldSpec = tuple[str, Callable[[Any], Any] | None]
+
+_PC_FIELD_MAP: dict[str, _FieldSpec] = {
+    "firstName": ("first_name", None),
+    "lastName": ("last_name", None),
+    "caseStatus": ("case_status", lambda v: CaseStatus(v).value),
+    "currentGrade": ("current_grade", None),
+    "notes": ("notes", None),
+}
+_SESSION_FIELD_MAP: dict[str, _FieldSpec] = {
+    "phase": ("phase", lambda v: SessionPhase(v).value),
+    "durationSeconds": ("duration_seconds", int),
+    "taStart": ("ta_start", float),
+    "taEnd": ("ta_end", float),
+    "taMotion": ("ta_motion", float),
+    "indicators": ("indicators", None),
+    "notes": ("notes", None),
+}
+
+LIST_PCS_SQL = "SELECT * FROM pc_profiles ORDER BY updated_at DESC"
+LIST_SESSIONS_SQL = "SELECT * FROM sessions WHERE pc_id = ? ORDER BY session_number DESC"
+
+# Rows pulled per thread hop when iterating a cursor (aiosqlite defaults to 1)
+ITER_BATCH_ROWS = 256
+
+# --- Bulk insert statements (one string each, so sqlite3's statement cache hits) ---
+
+INSERT_TRANSCRIPT_SQL = (
+    "INSERT INTO transcript_entries"
+    " (session_id, turn_number, speaker, text, needle_action, tone_arm, timestamp)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_METER_SQL = (
+    "INSERT INTO meter_readings"
+    " (session_id, timestamp, needle_action, position, tone_arm, sensitivity)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+INSERT_TONE_SQL = (
+    "INSERT INTO tone_readings (session_id, tone_level, tone_name, timestamp)"
+    " VALUES (?, ?, ?, ?)"
+)
+INSERT_EMOTION_SQL = (
+    "INSERT INTO emotion_snapshots"
+    " (session_id, dominant, confidence, emotions_json, prosody_json, timestamp)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+# Read-only connections kept open on the central index; SELECTs round-robin
+# across them so reads never queue behind the writer's thread
+CENTRAL_READERS = 2
+
+# Case DBs kept open at once; past this the least recently used PC without
+# an active session is closed (each open case holds its own threads)
+CASE_DB_CACHE_SIZE = 16
+
+
+class _CaseConnections:
+    """Writer and (lazily opened) reader connections for one per-PC case database."""
+
+    __slots__ = ("path", "writer", "reader", "write_lock", "users", "idle")
+
+    def __init__(self, path: Path, writer: aiosqlite.Connection) -> None:
+        self.path = path
+        self.writer = writer
+        self.reader: aiosqlite.Connection | None = None
+        self.write_lock = asyncio.Lock()
+        # Callers inside _case_use(); close_case() waits for idle before closing
+        self.users = 0
+        self.idle = asyncio.Event()
+        self.idle.set()
+
+
+def _set_clauses(field_map: dict[str, _FieldSpec], updates: dict) -> tuple[list[str], list]:
+    """"col=?" clauses and values for the keys of `updates` in field_map.
+
+    Unknown keys are ignored and None means "leave unchanged" (every mapped
+    column is NOT NULL). Coercions raise before anything reaches the DB.
+    """
+    clauses, values = [], []
+    for key, value in updates.items():
+        spec = field_map.get(key)
+        if spec is None or value is None:
+            continue
+        column, coerce = spec
+        clauses.append(f"{column}=?")
+        values.append(value if coerce is None else coerce(value))
+    return clauses, values
+
+
+def _now_ms() -> int:
+    """Current time in epoch milliseconds, the stored timestamp format."""
+    return time.time_ns() // 1_000_000
+
+
+async def _connect(path: Path, *, read_only: bool = False) -> aiosqlite.Connection:
+    db = await aiosqlite.connect(str(path))
+    db.row_factory = aiosqlite.Row
+    await db.executescript(CONNECTION_PRAGMAS)
+    if read_only:
+        await db.execute("PRAGMA query_only=ON")
+    return db
+
+
+@asynccontextmanager
+async def _tx(db: aiosqlite.Connection) -> AsyncIterator[aiosqlite.Connection]:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back if the body raises.
+
+    Taking the RESERVED lock up front means a write never has to upgrade
+    from a shared lock part-way through and fail with SQLITE_BUSY.
+    """
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        yield db
+    except BaseException:
+        await db.rollback()
+        raise
+    await db.commit()
+
+
+async def _iter_rows(
+    db: aiosqlite.Connection, sql: str, params: tuple = (),
+) -> AsyncIterator[aiosqlite.Row]:
+    """Stream a query's rows in ITER_BATCH_ROWS chunks instead of one fetchall()."""
+    async with db.execute(sql, params) as cursor:
+        cursor.arraysize = ITER_BATCH_ROWS
+        async for row in cursor:
+            yield row
+
+
+async def _migrate(
+    db: aiosqlite.Connection, schema: str, upgrades: dict[int, str], probe_table: str,
+) -> None:
+    """Bring a file up to SCHEMA_VERSION in one transaction.
+
+    A new file only needs the schema script. Files from before user_version
+    was stamped report 0 but already have probe_table; those are version 1.
+    """
+    cursor = await db.execute("PRAGMA user_version")
+    (version,) = await cursor.fetchone()
+    if version >= SCHEMA_VERSION:
+        return
+    if version == 0:
+        cursor = await db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (probe_table,)
+        )
+        version = 1 if await cursor.fetchone() is not None else SCHEMA_VERSION
+    steps = "".join(upgrades.get(v, "") for v in range(version, SCHEMA_VERSION))
+
+    # Rebuilding a table means dropping one other tables reference, so FK
+    # enforcement is off meanwhile (the pragma is ignored inside a transaction)
+    await db.execute("PRAGMA foreign_keys=OFF")
+    try:
+        await db.executescript(
+            f"BEGIN IMMEDIATE;\n{steps}\n{schema}\n"
+            f"PRAGMA user_version={SCHEMA_VERSION};\nCOMMIT;"
+        )
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        await db.execute("PRAGMA foreign_keys=ON")
+
 
 class DatabaseManager:
-    """Manages central index and per-PC case databases."""
+    """Manages central index and per-PC case databases.
+
+    Each database has one writer connection, used under an asyncio.Lock so
+    transactions never interleave, plus read-only connections for SELECTs
+    (WAL lets them run alongside the writer).
+    """
 
     def __init__(self):
         self._central_db: aiosqlite.Connection | None = None
+        self._central_readers: list[aiosqlite.Connection] = []
+        self._central_reader_cycle = itertools.cycle(())
+        self._central_write_lock = asyncio.Lock()
+        # Per-PC case DB connections, opened on first use, least recently used first
+        self._case_dbs: OrderedDict[str, _CaseConnections] = OrderedDict()
+        self._case_locks: dict[str, asyncio.Lock] = {}
+        # Active-session counts per PC; pinned cases are never evicted
+        self._case_pins: dict[str, int] = {}
 
     async def initialize(self) -> None:
         """Create dirs and initialize central index DB."""
-        MINDSCOPE_DIR.mkdir(parents=True, exist_ok=True)
-        CASE_FOLDERS.mkdir(parents=True, exist_ok=True)
+        # Filesystem calls run off the event loop; CASE_FOLDERS lives under
+        # MINDSCOPE_DIR, so one parents=True mkdir creates both
+        await asyncio.to_thread(CASE_FOLDERS.mkdir, parents=True, exist_ok=True)
 
-        self._central_db = await aiosqlite.connect(str(CENTRAL_DB))
-        self._central_db.row_factory = aiosqlite.Row
-        await self._central_db.execute("PRAGMA journal_mode=WAL")
-        await self._central_db.executescript(CENTRAL_SCHEMA)
-        await self._central_db.commit()
+        self._central_db = await _connect(CENTRAL_DB)
+        await _migrate(self._central_db, CENTRAL_SCHEMA, CENTRAL_UPGRADES, "pc_profiles")
+        self._central_readers = [
+            await _connect(CENTRAL_DB, read_only=True) for _ in range(CENTRAL_READERS)
+        ]
+        self._central_reader_cycle = itertools.cycle(self._central_readers)
 
     async def close(self) -> None:
-        """Close central DB connection."""
+        """Close the central DB and every cached case DB connection."""
+        for pc_id in list(self._case_dbs):
+            await self.close_case(pc_id)
+        for reader in self._central_readers:
+            await reader.close()
+        self._central_readers = []
+        self._central_reader_cycle = itertools.cycle(())
         if self._central_db:
             await self._central_db.close()
             self._central_db = None
@@ -192,114 +511,206 @@ class DatabaseManager:
 
     @property
     def central(self) -> aiosqlite.Connection:
+        """The central index writer; use inside _central_writer()."""
         assert self._central_db is not None, "Database not initialized"
         return self._central_db
 
-    async def _open_case_db(self, pc_id: str) -> aiosqlite.Connection:
-        """Open (or create) a per-PC case database."""
-        folder = CASE_FOLDERS / pc_id
-        folder.mkdir(parents=True, exist_ok=True)
-        db_path = folder / "case.db"
-
-        db = await aiosqlite.connect(str(db_path))
-        db.row_factory = aiosqlite.Row
-        await db.execute("PRAGMA journal_mode=WAL")
-        await db.executescript(CASE_SCHEMA)
-        await db.commit()
-        return db
+    @property
+    def central_reader(self) -> aiosqlite.Connection:
+        """Next read-only central connection."""
+        assert self._central_db is not None, "Database not initialized"
+        return next(self._central_reader_cycle)
+
+    @asynccontextmanager
+    async def _central_writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """The central writer, locked, inside a transaction committed on exit."""
+        async with self._central_write_lock, _tx(self.central) as db:
+            yield db
+
+    # --- Case DB helpers ---
+
+    async def _case(self, pc_id: str) -> _CaseConnections:
+        """Get the per-PC case connections, opening (or creating) the DB on first use."""
+        case = self._case_dbs.get(pc_id)
+        if case is not None:
+            self._case_dbs.move_to_end(pc_id)
+            return case
+        lock = self._case_locks.setdefault(pc_id, asyncio.Lock())
+        async with lock:
+            case = self._case_dbs.get(pc_id)
+            if case is not None:
+                return case
+            folder = CASE_FOLDERS / pc_id
+            await asyncio.to_thread(folder.mkdir, parents=True, exist_ok=True)
+            db_path = folder / "case.db"
+
+            writer = await _connect(db_path)
+            await _migrate(writer, CASE_SCHEMA, CASE_UPGRADES, "sessions")
+            case = _CaseConnections(db_path, writer)
+            self._case_dbs[pc_id] = case
+        await self._evict_cases(keep=pc_id)
+        return case
+
+    async def _evict_cases(self, keep: str) -> None:
+        """Close least recently used case DBs beyond CASE_DB_CACHE_SIZE.
+
+        Pinned cases and cases in use are skipped; the cache may run over
+        the cap until they free up.
+        """
+        for pc_id in list(self._case_dbs):
+            if len(self._case_dbs) <= CASE_DB_CACHE_SIZE:
+                return
+            # Re-checked per entry: earlier closes await, and state moves on
+            case = self._case_dbs.get(pc_id)
+            if case is None or case.users or pc_id == keep or pc_id in self._case_pins:
+                continue
+            await self.close_case(pc_id)
+
+    @asynccontextmanager
+    async def _case_use(self, pc_id: str) -> AsyncIterator[_CaseConnections]:
+        """A PC's cached case connections, held open for the block.
+
+        While any caller holds a case, eviction skips it and close_case()
+        waits for it to be released before closing the connections.
+        """
+        case = await self._case(pc_id)
+        # No await between the membership check and taking the reference
+        while self._case_dbs.get(pc_id) is not case:
+            case = await self._case(pc_id)
+        case.users += 1
+        case.idle.clear()
+        try:
+            yield case
+        finally:
+            case.users -= 1
+            if not case.users:
+                case.idle.set()
+
+    def pin_case(self, pc_id: str) -> None:
+        """Keep a PC's case DB open (e.g. for a running session) until unpinned."""
+        self._case_pins[pc_id] = self._case_pins.get(pc_id, 0) + 1
+
+    def unpin_case(self, pc_id: str) -> None:
+        """Release a pin_case(); the case DB becomes evictable again."""
+        count = self._case_pins.get(pc_id, 0) - 1
+        if count > 0:
+            self._case_pins[pc_id] = count
+        else:
+            self._case_pins.pop(pc_id, None)
+
+    @asynccontextmanager
+    async def _case_reader(self, pc_id: str) -> AsyncIterator[aiosqlite.Connection]:
+        """The per-PC case DB read-only connection, held open until exit.
+
+        Opened on the first read, so PCs that are only written to (e.g. just
+        created) cost one connection rather than two.
+        """
+        async with self._case_use(pc_id) as case:
+            # Serialised with writers so two first reads don't both open one
+            async with case.write_lock:
+                if case.reader is None:
+                    case.reader = await _connect(case.path, read_only=True)
+            yield case.reader
+
+    @asynccontextmanager
+    async def _case_writer(self, pc_id: str) -> AsyncIterator[aiosqlite.Connection]:
+        """A PC's case writer, locked, inside a transaction committed on exit."""
+        while True:
+            async with self._case_use(pc_id) as case, case.write_lock:
+                # close_case() may have dropped the case while we waited for
+                # the lock; its connections are about to go, so reopen
+                if self._case_dbs.get(pc_id) is not case:
+                    continue
+                async with _tx(case.writer) as db:
+                    yield db
+                return
+
+    async def close_case(self, pc_id: str) -> None:
+        """Close and forget the cached case DB connections for a PC, if any.
+
+        Waits for callers still holding the case (see _case_use) to finish.
+        """
+        case = self._case_dbs.pop(pc_id, None)
+        self._case_locks.pop(pc_id, None)
+        if case is not None:
+            await case.idle.wait()
+            if case.reader is not None:
+                await case.reader.close()
+            await case.writer.close()
 
     # --- PC CRUD ---
 
     async def create_pc(self, pc: PCModel) -> PCModel:
         """Create a new PC profile in central index and init case DB."""
-        now = datetime.utcnow().isoformat()
-        pc.created_at = datetime.fromisoformat(now)
-        pc.updated_at = datetime.fromisoformat(now)
-
-        await self.central.execute(
-            """INSERT INTO pc_profiles (id, first_name, last_name, case_status,
-               current_grade, notes, created_at, updated_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (pc.id, pc.first_name, pc.last_name, pc.case_status.value,
-             pc.current_grade, pc.notes, now, now),
-        )
-        await self.central.commit()
+        now = _now_ms()
+        pc.created_at = pc.updated_at = from_epoch_ms(now)
+
+        async with self._central_writer() as db:
+            await db.execute(
+                """INSERT INTO pc_profiles (id, first_name, last_name, case_status,
+                   current_grade, notes, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (pc.id, pc.first_name, pc.last_name, pc.case_status.value,
+                 pc.current_grade, pc.notes, now, now),
+            )
 
         # Initialize per-PC case database
-        case_db = await self._open_case_db(pc.id)
-        await case_db.close()
+        await self._case(pc.id)
 
         return pc
 
     async def get_pc(self, pc_id: str) -> PCModel | None:
         """Get a PC profile by ID."""
-        cursor = await self.central.execute(
+        cursor = await self.central_reader.execute(
             "SELECT * FROM pc_profiles WHERE id = ?", (pc_id,)
         )
         row = await cursor.fetchone()
         if row is None:
             return None
-        return PCModel.from_row(dict(row))
+        return PCModel.from_row(row)
 
-    async def list_pcs(self) -> list[PCModel]:
-        """List all PC profiles."""
-        cursor = await self.central.execute(
-            "SELECT * FROM pc_profiles ORDER BY updated_at DESC"
-        )
-        rows = await cursor.fetchall()
-        return [PCModel.from_row(dict(row)) for row in rows]
+    async def list_pc_dicts(self) -> list[dict]:
+        """List all PC profiles, most recently updated first, as to_dict() payloads."""
+        return [
+            PCModel.row_to_dict(row)
+            async for row in _iter_rows(self.central_reader, LIST_PCS_SQL)
+        ]
 
     async def update_pc(self, pc_id: str, updates: dict) -> PCModel | None:
         """Update PC profile fields. `updates` uses camelCase keys."""
-        pc = await self.get_pc(pc_id)
-        if pc is None:
+        # Only the provided columns are written
+        clauses, values = _set_clauses(_PC_FIELD_MAP, updates)
+        clauses.append("updated_at=?")
+        values += (_now_ms(), pc_id)
+
+        async with self._central_writer() as db:
+            cursor = await db.execute(
+                f"UPDATE pc_profiles SET {', '.join(clauses)} WHERE id=? RETURNING *",
+                values,
+            )
+            rows = await cursor.fetchall()
+        if not rows:
             return None
-
-        if "firstName" in updates:
-            pc.first_name = updates["firstName"]
-        if "lastName" in updates:
-            pc.last_name = updates["lastName"]
-        if "caseStatus" in updates:
-            pc.case_status = CaseStatus(updates["caseStatus"])
-        if "currentGrade" in updates:
-            pc.current_grade = updates["currentGrade"]
-        if "notes" in updates:
-            pc.notes = updates["notes"]
-
-        pc.updated_at = datetime.utcnow()
-
-        await self.central.execute(
-            """UPDATE pc_profiles SET first_name=?, last_name=?, case_status=?,
-               current_grade=?, notes=?, updated_at=? WHERE id=?""",
-            (pc.first_name, pc.last_name, pc.case_status.value,
-             pc.current_grade, pc.notes, pc.updated_at.isoformat(), pc.id),
-        )
-        await self.central.commit()
-        return pc
+        return PCModel.from_row(rows[0])
 
     async def delete_pc(self, pc_id: str) -> bool:
-        """Delete a PC profile and its case folder."""
-        pc = await self.get_pc(pc_id)
-        if pc is None:
+        """Delete a PC profile and its case folder.
+
+        Raises ValueError while a session holds the PC's case DB (see
+        pin_case); its writes would recreate the folder being removed.
+        """
+        # The DELETE's rowcount says whether the PC existed; no lookup first
+        async with self._central_writer() as db:
+            if pc_id in self._case_pins:
+                raise ValueError(f"PC has an active session: {pc_id}")
+            cursor = await db.execute("DELETE FROM pc_profiles WHERE id = ?", (pc_id,))
+        if cursor.rowcount == 0:
             return False
+        await self.close_case(pc_id)
 
-        await self.central.execute("DELETE FROM pc_profiles WHERE id = ?", (pc_id,))
-        await self.central.commit()
-
-        # Remove case folder
-        case_dir = CASE_FOLDERS / pc_id
-        if case_dir.exists():
-            case_db_path = case_dir / "case.db"
-            # Remove WAL/SHM files too
-            for suffix in ("", "-wal", "-shm"):
-                p = Path(str(case_db_path) + suffix)
-                if p.exists():
-                    p.unlink()
-            if case_dir.exists():
-                try:
-                    case_dir.rmdir()
-                except OSError:
-                    pass  # non-empty dir, leave it
+        # Remove the whole case folder (DB, WAL/SHM, anything else left in it)
+        # off the event loop; the connections are closed above
+        await asyncio.to_thread(shutil.rmtree, CASE_FOLDERS / pc_id, ignore_errors=True)
 
         return True
 
@@ -307,103 +718,118 @@ class DatabaseManager:
 
     async def create_session(self, session: SessionRecord) -> SessionRecord:
         """Create a new session in the PC's case database."""
-        now = datetime.utcnow().isoformat()
-        session.created_at = datetime.fromisoformat(now)
-        session.updated_at = datetime.fromisoformat(now)
+        now = _now_ms()
+        session.created_at = session.updated_at = from_epoch_ms(now)
 
-        case_db = await self._open_case_db(session.pc_id)
-        try:
-            # Auto-increment session number
+        # Session number is assigned inside the INSERT, so the MAX() read and
+        # the write can't race another create
+        async with self._case_writer(session.pc_id) as case_db:
             cursor = await case_db.execute(
-                "SELECT COALESCE(MAX(session_number), 0) FROM sessions WHERE pc_id = ?",
-                (session.pc_id,),
-            )
-            row = await cursor.fetchone()
-            session.session_number = (row[0] if row else 0) + 1
-
-            await case_db.execute(
                 """INSERT INTO sessions (id, pc_id, phase, session_number,
                    duration_seconds, ta_start, ta_end, ta_motion, indicators,
                    notes, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (session.id, session.pc_id, session.phase.value,
-                 session.session_number, session.duration_seconds,
-                 session.ta_start, session.ta_end, session.ta_motion,
-                 session.indicators, session.notes, now, now),
+                   SELECT ?, ?, ?,
+                       COALESCE((SELECT MAX(session_number) FROM sessions WHERE pc_id = ?), 0) + 1,
+                       ?, ?, ?, ?, ?, ?, ?, ?
+                   RETURNING session_number""",
+                (session.id, session.pc_id, session.phase.value, session.pc_id,
+                 session.duration_seconds, session.ta_start, session.ta_end,
+                 session.ta_motion, session.indicators, session.notes, now, now),
             )
-            await case_db.commit()
-        finally:
-            await case_db.close()
+            row = await cursor.fetchone()
+        session.session_number = row[0]
 
         return session
 
     async def get_session(self, pc_id: str, session_id: str) -> SessionRecord | None:
         """Get a session by ID from the PC's case database."""
-        case_db = await self._open_case_db(pc_id)
-        try:
+        async with self._case_reader(pc_id) as case_db:
             cursor = await case_db.execute(
                 "SELECT * FROM sessions WHERE id = ?", (session_id,)
             )
             row = await cursor.fetchone()
-            if row is None:
-                return None
-            return SessionRecord.from_row(dict(row))
-        finally:
-            await case_db.close()
+        if row is None:
+            return None
+        return SessionRecord.from_row(row)
 
-    async def list_sessions(self, pc_id: str) -> list[SessionRecord]:
-        """List all sessions for a PC."""
-        case_db = await self._open_case_db(pc_id)
-        try:
+    async def list_session_dicts(self, pc_id: str) -> list[dict]:
+        """List a PC's sessions, newest first, as to_dict() payloads."""
+        async with self._case_reader(pc_id) as case_db:
+            return [
+                SessionRecord.row_to_dict(row)
+                async for row in _iter_rows(case_db, LIST_SESSIONS_SQL, (pc_id,))
+            ]
+
+    async def update_session(self, pc_id: str, session_id: str, updates: dict) -> SessionRecord | None:
+        """Update session fields. `updates` uses camelCase keys."""
+        clauses, values = _set_clauses(_SESSION_FIELD_MAP, updates)
+        clauses.append("updated_at=?")
+        values += (_now_ms(), session_id)
+
+        async with self._case_writer(pc_id) as case_db:
             cursor = await case_db.execute(
-                "SELECT * FROM sessions WHERE pc_id = ? ORDER BY session_number DESC",
-                (pc_id,),
+                f"UPDATE sessions SET {', '.join(clauses)} WHERE id=? RETURNING *",
+                values,
             )
             rows = await cursor.fetchall()
-            return [SessionRecord.from_row(dict(row)) for row in rows]
-        finally:
-            await case_db.close()
-
-    async def update_session(self, pc_id: str, session_id: str, updates: dict) -> SessionRecord | None:
-        """Update session fields."""
-        session = await self.get_session(pc_id, session_id)
-        if session is None:
+        if not rows:
             return None
-
-        from .models import SessionPhase
-        if "phase" in updates:
-            session.phase = SessionPhase(updates["phase"])
-        if "durationSeconds" in updates:
-            session.duration_seconds = updates["durationSeconds"]
-        if "taStart" in updates:
-            session.ta_start = updates["taStart"]
-        if "taEnd" in updates:
-            session.ta_end = updates["taEnd"]
-        if "taMotion" in updates:
-            session.ta_motion = updates["taMotion"]
-        if "indicators" in updates:
-            session.indicators = updates["indicators"]
-        if "notes" in updates:
-            session.notes = updates["notes"]
-
-        session.updated_at = datetime.utcnow()
-
-        case_db = await self._open_case_db(pc_id)
-        try:
+        return SessionRecord.from_row(rows[0])
+
+    # --- Bulk inserts (per-PC case DB) ---
+    #
+    # Row tuples follow the column order of each INSERT. All rows go through
+    # one executemany in one transaction.
+
+    async def _insert_many(self, pc_id: str, sql: str, rows: Iterable[tuple]) -> None:
+        async with self._case_writer(pc_id) as case_db:
+            await case_db.executemany(sql, rows)
+
+    async def add_transcript_entries(self, pc_id: str, rows: Iterable[tuple]) -> None:
+        """Rows: (session_id, turn_number, speaker, text, needle_action, tone_arm, timestamp)."""
+        await self._insert_many(pc_id, INSERT_TRANSCRIPT_SQL, rows)
+
+    async def update_transcript_text(
+        self, pc_id: str, session_id: str, turn_number: int, speaker: str,
+        timestamp: str, text: str,
+    ) -> None:
+        """Replace the text of one already-written transcript entry."""
+        async with self._case_writer(pc_id) as case_db:
             await case_db.execute(
-                """UPDATE sessions SET phase=?, duration_seconds=?, ta_start=?,
-                   ta_end=?, ta_motion=?, indicators=?, notes=?, updated_at=?
-                   WHERE id=?""",
-                (session.phase.value, session.duration_seconds,
-                 session.ta_start, session.ta_end, session.ta_motion,
-                 session.indicators, session.notes,
-                 session.updated_at.isoformat(), session.id),
+                """UPDATE transcript_entries SET text = ?
+                   WHERE session_id = ? AND turn_number = ? AND speaker = ?
+                   AND timestamp = ?""",
+                (text, session_id, turn_number, speaker, timestamp),
             )
-            await case_db.commit()
-        finally:
-            await case_db.close()
 
-        return session
+    async def add_meter_readings(self, pc_id: str, rows: Iterable[tuple]) -> None:
+        """Rows: (session_id, timestamp, needle_action, position, tone_arm, sensitivity)."""
+        await self._insert_many(pc_id, INSERT_METER_SQL, rows)
+
+    async def add_tone_readings(self, pc_id: str, rows: Iterable[tuple]) -> None:
+        """Rows: (session_id, tone_level, tone_name, timestamp)."""
+        await self._insert_many(pc_id, INSERT_TONE_SQL, rows)
+
+    async def add_emotion_snapshots(self, pc_id: str, rows: Iterable[tuple]) -> None:
+        """Rows: (session_id, dominant, confidence, emotions_json, prosody_json, timestamp)."""
+        await self._insert_many(pc_id, INSERT_EMOTION_SQL, rows)
+
+    async def get_pc_summary(self, pc_id: str) -> dict:
+        """Session count, last session time and total duration for a PC."""
+        async with self._case_reader(pc_id) as case_db:
+            cursor = await case_db.execute(
+                """SELECT session_count, last_session_at, total_duration
+                   FROM pc_summary WHERE pc_id = ?""",
+                (pc_id,),
+            )
+            row = await cursor.fetchone()
+        if row is None:
+            return {"sessionCount": 0, "lastSessionAt": None, "totalDurationSeconds": 0}
+        return {
+            "sessionCount": row[0],
+            "lastSessionAt": from_epoch_ms(row[1]).isoformat() if row[1] is not None else None,
+            "totalDurationSeconds": row[2],
+        }
 
     # --- DB Status ---
 
@@ -411,13 +837,13 @@ class DatabaseManager:
         """Get database health status."""
         status = {
             "centralDb": str(CENTRAL_DB),
-            "centralExists": CENTRAL_DB.exists(),
+            "centralExists": await asyncio.to_thread(CENTRAL_DB.exists),
             "caseFoldersDir": str(CASE_FOLDERS),
         }
 
         if self._central_db:
             try:
-                cursor = await self.central.execute("SELECT COUNT(*) FROM pc_profiles")
+                cursor = await self.central_reader.execute("SELECT COUNT(*) FROM pc_profiles")
                 row = await cursor.fetchone()
                 status["pcCount"] = row[0] if row else 0
                 status["ready"] = True
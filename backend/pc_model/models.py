@@ -1,8 +1,10 @@
 """PC (preclear) data models."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+from typing import Any
 import uuid
 
 
@@ -23,7 +25,20 @@ class CaseStatus(Enum):
     ARCHIVED = "archived"
 
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1)
+
+
+def from_epoch_ms(ms: int) -> datetime:
+    """Epoch milliseconds -> naive UTC datetime."""
+    return _EPOCH + timedelta(milliseconds=ms)
+
+
+# Value -> member lookups for row decoding (skips Enum.__call__ per row)
+_STATUS_BY_VALUE = {m.value: m for m in CaseStatus}
+_PHASE_BY_VALUE = {m.value: m for m in SessionPhase}
+
+
+@dataclass(slots=True)
 class PCModel:
     """A preclear profile."""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -61,21 +76,35 @@ class PCModel:
         )
 
     @classmethod
-    def from_row(cls, row: dict) -> "PCModel":
-        """Create from SQLite row dict."""
+    def from_row(cls, row: Mapping[str, Any]) -> "PCModel":
+        """Create from a pc_profiles row (aiosqlite.Row or any column-keyed mapping)."""
         return cls(
             id=row["id"],
             first_name=row["first_name"],
             last_name=row["last_name"],
-            case_status=CaseStatus(row["case_status"]),
+            case_status=_STATUS_BY_VALUE[row["case_status"]],
             current_grade=row["current_grade"],
             notes=row["notes"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
+            created_at=from_epoch_ms(row["created_at"]),
+            updated_at=from_epoch_ms(row["updated_at"]),
         )
 
+    @staticmethod
+    def row_to_dict(row: Mapping[str, Any]) -> dict:
+        """to_dict() straight from a pc_profiles row, without building a PCModel."""
+        return {
+            "id": row["id"],
+            "firstName": row["first_name"],
+            "lastName": row["last_name"],
+            "caseStatus": row["case_status"],
+            "currentGrade": row["current_grade"],
+            "notes": row["notes"],
+            "createdAt": from_epoch_ms(row["created_at"]).isoformat(),
+            "updatedAt": from_epoch_ms(row["updated_at"]).isoformat(),
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class SessionRecord:
     """A session record for a PC."""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -125,23 +154,42 @@ class SessionRecord:
         )
 
     @classmethod
-    def from_row(cls, row: dict) -> "SessionRecord":
-        """Create from SQLite row dict."""
+    def from_row(cls, row: Mapping[str, Any]) -> "SessionRecord":
+        """Create from a sessions row (aiosqlite.Row or any column-keyed mapping)."""
         return cls(
             id=row["id"],
             pc_id=row["pc_id"],
-            phase=SessionPhase(row["phase"]),
+            phase=_PHASE_BY_VALUE[row["phase"]],
             session_number=row["session_number"],
             duration_seconds=row["duration_seconds"],
-            ta_start=row["ta_start"],
-            ta_end=row["ta_end"],
-            ta_motion=row["ta_motion"],
+            # UPDATE ... RETURNING can hand back integral REALs as int
+            ta_start=float(row["ta_start"]),
+            ta_end=float(row["ta_end"]),
+            ta_motion=float(row["ta_motion"]),
             indicators=row["indicators"],
             notes=row["notes"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
+            created_at=from_epoch_ms(row["created_at"]),
+            updated_at=from_epoch_ms(row["updated_at"]),
         )
 
+    @staticmethod
+    def row_to_dict(row: Mapping[str, Any]) -> dict:
+        """to_dict() straight from a sessions row, without building a SessionRecord."""
+        return {
+            "id": row["id"],
+            "pcId": row["pc_id"],
+            "phase": row["phase"],
+            "sessionNumber": row["session_number"],
+            "durationSeconds": row["duration_seconds"],
+            "taStart": float(row["ta_start"]),
+            "taEnd": float(row["ta_end"]),
+            "taMotion": float(row["ta_motion"]),
+            "indicators": row["indicators"],
+            "notes": row["notes"],
+            "createdAt": from_epoch_ms(row["created_at"]).isoformat(),
+            "updatedAt": from_epoch_ms(row["updated_at"]).isoformat(),
+        }
+
 
 @dataclass
 class GradeCompletion:
@@ -0,0 +1,72 @@
+"""DatabaseManager tests against throwaway central and case databases."""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from backend.pc_model import database
+from backend.pc_model.database import DatabaseManager
+from backend.pc_model.models import PCModel, SessionRecord
+
+
+class DatabaseTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        for name, value in (
+            ("MINDSCOPE_DIR", root),
+            ("CENTRAL_DB", root / "mindscope.db"),
+            ("CASE_FOLDERS", root / "case_folders"),
+        ):
+            patcher = mock.patch.object(database, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.db = DatabaseManager()
+        await self.db.initialize()
+        self.addAsyncCleanup(self.db.close)
+
+
+class CaseCacheTest(DatabaseTestCase):
+    async def test_eviction_never_closes_a_case_in_use(self) -> None:
+        pcs = [
+            await self.db.create_pc(PCModel(first_name=str(i)))
+            for i in range(database.CASE_DB_CACHE_SIZE + 8)
+        ]
+
+        async def worker(n: int) -> None:
+            for i in range(6):
+                pc = pcs[(n * 7 + i * 5) % len(pcs)]
+                if i % 3 == 0:
+                    await self.db.create_session(SessionRecord(pc_id=pc.id))
+                elif i % 3 == 1:
+                    await self.db.list_session_dicts(pc.id)
+                else:
+                    await self.db.get_pc_summary(pc.id)
+
+        results = await asyncio.gather(*(worker(n) for n in range(20)), return_exceptions=True)
+        self.assertEqual([r for r in results if r is not None], [])
+        self.assertLessEqual(len(self.db._case_dbs), database.CASE_DB_CACHE_SIZE)
+        self.assertEqual(sum(c.users for c in self.db._case_dbs.values()), 0)
+
+
+class DeletePCTest(DatabaseTestCase):
+    async def test_delete_refused_while_session_active(self) -> None:
+        pc = await self.db.create_pc(PCModel(first_name="Test"))
+        await self.db.create_session(SessionRecord(pc_id=pc.id))
+        self.db.pin_case(pc.id)
+        with self.assertRaises(ValueError):
+            await self.db.delete_pc(pc.id)
+        self.assertIsNotNone(await self.db.get_pc(pc.id))
+        self.assertEqual(len(await self.db.list_session_dicts(pc.id)), 1)
+
+        self.db.unpin_case(pc.id)
+        self.assertTrue(await self.db.delete_pc(pc.id))
+        self.assertFalse((database.CASE_FOLDERS / pc.id).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""SessionManager tests against a throwaway case database."""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from backend.orchestrator.session_manager import START_RUDIMENTS, SessionManager
+from backend.pc_model import database
+from backend.pc_model.database import DatabaseManager
+from backend.pc_model.models import PCModel, SessionRecord
+
+
+class SessionManagerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        for name, value in (
+            ("MINDSCOPE_DIR", root),
+            ("CENTRAL_DB", root / "mindscope.db"),
+            ("CASE_FOLDERS", root / "case_folders"),
+        ):
+            patcher = mock.patch.object(database, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.db = DatabaseManager()
+        await self.db.initialize()
+        self.addAsyncCleanup(self.db.close)
+        self.pc = await self.db.create_pc(PCModel(first_name="Test"))
+        self.session = await self.db.create_session(SessionRecord(pc_id=self.pc.id))
+        self.sent: list[dict] = []
+
+    async def _broadcast(self, msg) -> None:
+        self.sent.append(json.loads(msg.to_json()))
+
+    async def _broadcast_many(self, msgs) -> None:
+        for msg in msgs:
+            await self._broadcast(msg)
+
+    def _manager(self, **kwargs) -> SessionManager:
+        return SessionManager(
+            self.pc.id, self.session.id, self.db, self._broadcast,
+            broadcast_many_fn=self._broadcast_many, **kwargs,
+        )
+
+
+class RudimentTimestampTest(SessionManagerTestCase):
+    async def test_rudiment_broadcast_uses_transcript_timestamp(self) -> None:
+        sm = self._manager()
+        await sm.start()
+        await sm.process_pc_input("yes")
+        await sm.close()
+
+        chats = [m["data"] for m in self.sent if m["type"] == "chat.message"]
+        rudiments = [c for c in chats if c["speaker"] == "auditor"]
+        self.assertGreaterEqual(len(rudiments), 2)
+        stored = [
+            ts for ts, speaker in zip(sm._tx_timestamp, sm._tx_speaker)
+            if speaker == "auditor"
+        ]
+        self.assertEqual([c["timestamp"] for c in rudiments], stored[:len(rudiments)])
+
+
+class SlowAuditor:
+    """Stands in for AIAuditor; answers after a delay, one call at a time."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls = 0
+
+    def reset(self) -> None:
+        pass
+
+    async def respond(self, **kwargs) -> str:
+        await asyncio.sleep(self.delay)
+        self.calls += 1
+        return f"AI {self.calls}"
+
+
+class AITranscriptOrderTest(SessionManagerTestCase):
+    async def test_auditor_rows_stay_before_next_answer(self) -> None:
+        sm = self._manager(ai_auditor=SlowAuditor())
+        await sm.start()
+        for i in range(len(START_RUDIMENTS) + 4):
+            await sm.process_pc_input(f"answer {i}")
+            # Let some rows flush before the AI answers, some after
+            await asyncio.sleep(0.03)
+        await sm.end()
+
+        async with self.db._case_reader(self.pc.id) as case_db:
+            cursor = await case_db.execute(
+                "SELECT turn_number, speaker, text FROM transcript_entries"
+                " WHERE session_id = ? ORDER BY id",
+                (self.session.id,),
+            )
+            rows = [tuple(r) for r in await cursor.fetchall()]
+        # Every PC answer is followed by the auditor line for the same turn
+        for (turn, speaker, _), (next_turn, next_speaker, _) in zip(rows, rows[1:]):
+            if speaker == "pc":
+                self.assertEqual((next_turn, next_speaker), (turn, "auditor"))
+        ai_rows = [text for _, speaker, text in rows if text.startswith("AI ")]
+        self.assertEqual(len(ai_rows), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -84,6 +84,17 @@ export default function SessionPanel({
 
   const addChatMessage = useCallback((msg: ChatMessage) => {
     setMessages((prev) => {
+      if (msg.replaceTurn !== undefined) {
+        const idx = prev.findIndex((m) => m.pending
+          && m.speaker === msg.speaker
+          && m.turnNumber === msg.replaceTurn
+          && (m.sessionId ?? null) === (msg.sessionId ?? null));
+        if (idx !== -1) {
+          const next = [...prev];
+          next[idx] = { ...prev[idx], ...msg, pending: false };
+          return next;
+        }
+      }
       if (prev.some((m) => m.turnNumber === msg.turnNumber
           && m.speaker === msg.speaker
           && m.text === msg.text
@@ -62,6 +62,7 @@ interface TimelineMessage {
   chargeScore?: number;
   bodyMovement?: boolean;
   isAiGenerated?: boolean;
+  pending?: boolean;
 }
 
 const ANNOTATION_COLORS: Record<string, string> = {
@@ -187,6 +188,18 @@ export default function SignalMonitor({
         }
       }
 
+      if (data.replaceTurn !== undefined) {
+        const pendingEntry = timelineMessagesRef.current.find((m) => m.pending
+          && m.speaker === data.speaker
+          && m.turnNumber === data.replaceTurn);
+        if (pendingEntry) {
+          pendingEntry.text = data.text;
+          pendingEntry.isAiGenerated = data.isAiGenerated;
+          pendingEntry.pending = false;
+          return;
+        }
+      }
+
       timelineMessagesRef.current.push({
         speaker: data.speaker,
         text: data.text,
@@ -197,6 +210,7 @@ export default function SignalMonitor({
         chargeScore: data.chargeScore,
         bodyMovement: data.bodyMovement,
         isAiGenerated: data.isAiGenerated,
+        pending: data.pending,
       });
       const messageCap = MAX_POINTS;
       if (timelineMessagesRef.current.length > messageCap) {
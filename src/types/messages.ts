@@ -73,6 +73,14 @@ export interface PCProfile {
   notes: string;
   createdAt: string;
   updatedAt: string;
+  /** Only present on pc.data responses */
+  summary?: PCSummary;
+}
+
+export interface PCSummary {
+  sessionCount: number;
+  lastSessionAt: string | null;
+  totalDurationSeconds: number;
 }
 
 export interface SessionData {
@@ -211,6 +219,8 @@ export interface ChatMessage {
   questionDroppedAt?: number; // epoch seconds (auditor questions only)
   chargeScore?: number; // 0-100 charge score (conversational mode)
   bodyMovement?: boolean; // whether this was a body movement artifact
+  pending?: boolean; // placeholder auditor text, replaced once the AI answers
+  replaceTurn?: number; // replaces the pending auditor message for this turn
 }
 
 export interface ChargeMapEntry {